@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import os
 from typing import Callable, Optional
 
@@ -80,9 +81,9 @@ class FedAvg(BaseFedAvg):
 
             self.info(f"Round {self.current_round} global metrics: {model.metrics}")
 
-            self.select_best_model(model)
-
-            self.save_model(self.best_model, os.path.join(os.getcwd(), self.save_filename))
+            # only write the best model when it changed this round
+            if self.select_best_model(model):
+                self.save_model(self.best_model, os.path.join(os.getcwd(), self.save_filename))
 
             if self.should_stop(model.metrics, self.stop_condition):
                 self.info(
@@ -104,18 +105,22 @@ class FedAvg(BaseFedAvg):
 
         return op_fn(value, target)
 
-    def select_best_model(self, curr_model: FLModel):
-        if self.best_model is None:
-            self.best_model = curr_model
-            return
-
-        if self.stop_condition:
+    def select_best_model(self, curr_model: FLModel) -> bool:
+        if self.best_model is not None and self.stop_condition:
             metric, _, op_fn = self.stop_condition
-            if self.is_curr_model_better(self.best_model, curr_model, metric, op_fn):
-                self.info("Current model is new best model.")
-                self.best_model = curr_model
+            if not self.is_curr_model_better(self.best_model, curr_model, metric, op_fn):
+                return False
+            self.info("Current model is new best model.")
+
+        # update_model() updates the global model every round, so keep a snapshot of the best one
+        if self.inplace_update:
+            # the params are added into in place, so they must be copied as well
+            self.best_model = copy.deepcopy(curr_model)
         else:
-            self.best_model = curr_model
+            # the params are replaced rather than modified, so a new params dict is enough
+            self.best_model = copy.copy(curr_model)
+            self.best_model.params = dict(curr_model.params)
+        return True
 
     def is_curr_model_better(
         self, best_model: FLModel, curr_model: FLModel, target_metric: str, op_fn: Callable
@@ -127,7 +132,10 @@ class FedAvg(BaseFedAvg):
             return False
 
         best_metrics = best_model.metrics
-        return op_fn(curr_metrics.get(target_metric), best_metrics.get(target_metric))
+        if not best_metrics or target_metric not in best_metrics:
+            # nothing to compare against, e.g. the first model had no metrics
+            return True
+        return op_fn(curr_metrics[target_metric], best_metrics[target_metric])
 
     def save_model(self, model, filepath=""):
         params = model.params
@@ -73,7 +73,42 @@ class AnalyticsDataType(Enum):
     INIT_DATA = "INIT_DATA"
 
 
+def _expect_number(key: str, value):
+    if not isinstance(value, (float, int)):
+        raise TypeError(f"expect '{key}' value to be an instance of float or int, but got '{type(value)}'.")
+
+
+def _expect_dict(key: str, value):
+    if not isinstance(value, dict):
+        raise TypeError(f"expect '{key}' value to be an instance of dict, but got '{type(value)}'.")
+
+
+def _expect_str(key: str, value):
+    if not isinstance(value, str):
+        raise TypeError(f"expect '{key}' value to be an instance of str, but got '{type(value)}'.")
+
+
+def _expect_tags(key: str, value):
+    if not isinstance(value, dict):
+        raise TypeError(f"expect '{key}' data type expects value to be an instance of dict, but got '{type(value)}'")
+
+
+# value checks are looked up per data type instead of walking an if/elif chain for every logged metric
+_VALUE_VALIDATORS = {
+    AnalyticsDataType.SCALAR: _expect_number,
+    AnalyticsDataType.METRIC: _expect_number,
+    AnalyticsDataType.SCALARS: _expect_dict,
+    AnalyticsDataType.METRICS: _expect_dict,
+    AnalyticsDataType.PARAMETERS: _expect_dict,
+    AnalyticsDataType.TEXT: _expect_str,
+    AnalyticsDataType.TAGS: _expect_tags,
+}
+
+
 class AnalyticsData:
+    # an AnalyticsData is created for every logged metric, so no per-instance __dict__ is allocated
+    __slots__ = ("tag", "value", "data_type", "kwargs", "sender", "step", "path")
+
     def __init__(
         self,
         key: str,
@@ -144,8 +179,9 @@ class AnalyticsData:
         value = data[TrackConst.TRACK_VALUE]
         kwargs = data.get(TrackConst.KWARGS_KEY, {})
         step = data.get(TrackConst.GLOBAL_STEP_KEY, None)
-        if step is not None:
-            kwargs[TrackConst.GLOBAL_STEP_KEY] = step
+        if step is not None and kwargs.get(TrackConst.GLOBAL_STEP_KEY) != step:
+            # the received data may be shared by other receivers, so it is not modified
+            kwargs = {**kwargs, TrackConst.GLOBAL_STEP_KEY: step}
         data_type = dxo.get_meta_prop(TrackConst.DATA_TYPE_KEY)
         writer = dxo.get_meta_prop(TrackConst.TRACKER_KEY)
         if writer is not None and writer != receiver:
@@ -183,22 +219,9 @@ class AnalyticsData:
         path = kwargs.get(TrackConst.PATH_KEY, None)
         if path and not isinstance(path, str):
             raise TypeError("expect path to be an instance of str, but got {}.".format(type(step)))
-        if data_type in [AnalyticsDataType.SCALAR, AnalyticsDataType.METRIC] and not (
-            isinstance(value, float) or isinstance(value, int)
-        ):
-            raise TypeError(f"expect '{key}' value to be an instance of float or int, but got '{type(value)}'.")
-        elif data_type in [
-            AnalyticsDataType.METRICS,
-            AnalyticsDataType.PARAMETERS,
-            AnalyticsDataType.SCALARS,
-        ] and not isinstance(value, dict):
-            raise TypeError(f"expect '{key}' value to be an instance of dict, but got '{type(value)}'.")
-        elif data_type == AnalyticsDataType.TEXT and not isinstance(value, str):
-            raise TypeError(f"expect '{key}' value to be an instance of str, but got '{type(value)}'.")
-        elif data_type == AnalyticsDataType.TAGS and not isinstance(value, dict):
-            raise TypeError(
-                f"expect '{key}' data type expects value to be an instance of dict, but got '{type(value)}'"
-            )
+        validate_value = _VALUE_VALIDATORS.get(data_type)
+        if validate_value is not None:
+            validate_value(key, value)
 
     @classmethod
     def convert_data_type(
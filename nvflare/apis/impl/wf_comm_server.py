@@ -1009,12 +1009,13 @@ class WFCommServer(FLComponent, WFCommSpec):
         def wrap(*args, **kwargs):
             if func:
                 func(*args, **kwargs)
-            task.props[_TASK_KEY_DONE] = True
+            task.props[_TASK_KEY_DONE].set()
 
         return wrap
 
     def wait_for_task(self, task: Task, abort_signal: Signal):
-        task.props[_TASK_KEY_DONE] = False
+        task_done = threading.Event()
+        task.props[_TASK_KEY_DONE] = task_done
         task.task_done_cb = self._process_finished_task(task=task, func=task.task_done_cb)
         while True:
             if task.completion_status is not None:
@@ -1024,10 +1025,9 @@ class WFCommServer(FLComponent, WFCommSpec):
                 self.cancel_task(task, fl_ctx=None, completion_status=TaskCompletionStatus.ABORTED)
                 break
 
-            task_done = task.props[_TASK_KEY_DONE]
-            if task_done:
+            # the done callback wakes this up right away; the timeout is only for noticing aborts
+            if task_done.wait(self._task_check_period):
                 break
-            time.sleep(self._task_check_period)
 
     def _job_policy_violated(self):
         if not self._engine:
@@ -58,6 +58,11 @@ class WeightedAggregationHelper(object):
                 if current_total is None:
                     self.total[k] = weighted_value
                     self.counts[k] = weight
+                elif self._can_add_inplace(current_total, weighted_value):
+                    current_total += weighted_value
+                    # immutable values such as numpy scalars are rebound rather than modified by "+="
+                    self.total[k] = current_total
+                    self.counts[k] = self.counts[k] + weight
                 else:
                     self.total[k] = current_total + weighted_value
                     self.counts[k] = self.counts[k] + weight
@@ -69,6 +74,16 @@ class WeightedAggregationHelper(object):
                 }
             )
 
+    def _can_add_inplace(self, current_total, weighted_value) -> bool:
+        # the total can only be accumulated in place if it was created by this helper (it is v * weight)
+        # and not the contributed data itself, and if the result would have the same dtype and shape.
+        if not self.weigh_by_local_iter:
+            return False
+        dtype = getattr(current_total, "dtype", None)
+        if dtype is None or dtype != getattr(weighted_value, "dtype", None):
+            return False
+        return getattr(current_total, "shape", None) == getattr(weighted_value, "shape", None)
+
     def get_result(self):
         """Divide weighted sum by sum of weights."""
         with self.lock:
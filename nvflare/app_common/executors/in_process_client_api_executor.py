@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import threading
-import time
 from typing import Optional
 
 from nvflare.apis.analytix import ANALYTIC_EVENT_TYPE
@@ -99,6 +98,7 @@ class InProcessClientAPIExecutor(Executor):
         self._data_bus.subscribe([TOPIC_LOG_DATA], self.log_result_callback)
         self._data_bus.subscribe([TOPIC_ABORT, TOPIC_STOP], self.to_abort_callback)
         self.local_result = None
+        self._local_result_received = threading.Event()
         self._fl_ctx = None
         self._task_fn_path = None
         self._task_fn_wrapper = None
@@ -170,8 +170,12 @@ class InProcessClientAPIExecutor(Executor):
                         result = self._to_nvflare_converter.process(task_name, result, fl_ctx)
                     return result
                 else:
-                    self.log_debug(fl_ctx, f"waiting for result, sleep for {self._result_pull_interval} secs")
-                    time.sleep(self._result_pull_interval)
+                    # wake up as soon as the result is received, and at least every result_pull_interval
+                    # to check the abort signal. Clearing after the wait is safe since the result itself
+                    # is kept in self.local_result and is checked again before waiting.
+                    self.log_debug(fl_ctx, f"waiting for result, up to {self._result_pull_interval} secs")
+                    self._local_result_received.wait(self._result_pull_interval)
+                    self._local_result_received.clear()
 
         except Exception:
             self.log_error(fl_ctx, secure_format_traceback())
@@ -221,10 +225,11 @@ class InProcessClientAPIExecutor(Executor):
     def local_result_callback(self, topic, data, databus):
         if not isinstance(data, Shareable):
             msg = f"bad task result from peer: expect Shareable but got {type(data)}"
-            self.logger(msg)
+            self.logger.error(msg)
             raise ValueError(msg)
 
         self.local_result = data
+        self._local_result_received.set()
 
     def log_result_callback(self, topic, data, databus):
         result = data
@@ -241,3 +246,5 @@ class InProcessClientAPIExecutor(Executor):
 
     def to_abort_callback(self, topic, data, databus):
         self._abort = True
+        # wake up execute so that the abort takes effect without waiting for the result pull interval
+        self._local_result_received.set()
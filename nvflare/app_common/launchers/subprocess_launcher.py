@@ -107,6 +107,7 @@ class SubprocessLauncher(Launcher):
         self._launch_once = launch_once
         self._clean_up_script = clean_up_script
         self._shutdown_timeout = shutdown_timeout
+        self._env = None
         self._lock = Lock()
         self.logger = get_obj_logger(self)
 
@@ -132,17 +133,20 @@ class SubprocessLauncher(Launcher):
         with self._lock:
             if self._process is None:
                 command = self._script
-                env = os.environ.copy()
-                env["CLIENT_API_TYPE"] = "EX_PROCESS_API"
+                if self._env is None:
+                    # the env only depends on the job, so build it once instead of on every launch
+                    env = os.environ.copy()
+                    env["CLIENT_API_TYPE"] = "EX_PROCESS_API"
 
-                workspace = fl_ctx.get_prop(FLContextKey.WORKSPACE_OBJECT)
-                job_id = fl_ctx.get_prop(FLContextKey.CURRENT_JOB_ID)
-                app_custom_folder = workspace.get_app_custom_dir(job_id)
-                add_custom_dir_to_path(app_custom_folder, env)
+                    workspace = fl_ctx.get_prop(FLContextKey.WORKSPACE_OBJECT)
+                    job_id = fl_ctx.get_prop(FLContextKey.CURRENT_JOB_ID)
+                    app_custom_folder = workspace.get_app_custom_dir(job_id)
+                    add_custom_dir_to_path(app_custom_folder, env)
+                    self._env = env
 
                 command_seq = shlex.split(command)
                 self._process = subprocess.Popen(
-                    command_seq, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=self._app_dir, env=env
+                    command_seq, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=self._app_dir, env=self._env
                 )
                 self._log_thread = Thread(target=log_subprocess_output, args=(self._process, self.logger))
                 self._log_thread.start()
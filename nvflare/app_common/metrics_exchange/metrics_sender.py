@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 from typing import Any
 
 from nvflare.apis.analytix import AnalyticsDataType
@@ -32,6 +33,7 @@ class MetricsSender(AnalyticsSender):
         heartbeat_interval: float = 5.0,
         heartbeat_timeout: float = 30.0,
         pipe_channel_name=PipeChannelName.METRIC,
+        flush_interval: float = 0.05,
     ):
         """MetricsSender is a special type of AnalyticsSender that uses `Pipe` to communicate.
 
@@ -41,6 +43,8 @@ class MetricsSender(AnalyticsSender):
             heartbeat_interval (float): Interval for sending heartbeat to the peer.
             heartbeat_timeout (float): Timeout for waiting for a heartbeat from the peer.
             pipe_channel_name: the channel name for sending task requests.
+            flush_interval (float): How long to wait after a metric is added before sending the buffered metrics
+                to the peer, so that metrics added close together are sent in one message.
 
         Note:
             Users can use MetricsSender with `FilePipe`, `CellPipe`, or any other customize
@@ -54,6 +58,14 @@ class MetricsSender(AnalyticsSender):
         self._heartbeat_timeout = heartbeat_timeout
         self._pipe_handler = None
         self._pipe_channel_name = pipe_channel_name
+        self._flush_interval = flush_interval
+        self._buffer = []
+        self._buffer_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._data_added = threading.Event()
+        self._stop_flush = threading.Event()
+        self._flusher = None
+        self._stopped = False
 
     def handle_event(self, event_type: str, fl_ctx: FLContext):
         if event_type == EventType.ABOUT_TO_START_RUN:
@@ -74,7 +86,62 @@ class MetricsSender(AnalyticsSender):
             )
             self._pipe_handler.start()
 
+            self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._flusher.start()
+        elif event_type in [EventType.ABOUT_TO_END_RUN, EventType.END_RUN]:
+            self._stop_sending()
+        elif event_type == EventType.ABORT_TASK:
+            # the run may not end normally after an abort, so send what has been logged so far
+            self._flush()
+
     def add(self, tag: str, value: Any, data_type: AnalyticsDataType, **kwargs):
         data = create_analytic_dxo(tag=tag, value=value, data_type=data_type, **kwargs)
-        req = Message.new_request(topic="_metrics_sender", data=data)
-        self._pipe_handler.send_to_peer(req)
+        with self._buffer_lock:
+            if self._stopped:
+                self.logger.warning(f"metric {tag} is dropped: metrics can no longer be sent after the run ended")
+                return
+            self._buffer.append(data)
+        self._data_added.set()
+
+    def _flush_periodically(self):
+        while True:
+            self._data_added.wait()
+            # wait a little so that metrics added close together are sent in one message
+            if self._stop_flush.wait(self._flush_interval):
+                return
+            self._data_added.clear()
+            self._flush()
+
+    def _flush(self):
+        # the send lock keeps batches in order when an event handler flushes while the flusher thread does
+        with self._send_lock:
+            if not self._pipe_handler:
+                # keep the metrics until there is a pipe handler to send them
+                return
+
+            # swap the buffer so that add() is not blocked while the batch is being sent
+            with self._buffer_lock:
+                batch, self._buffer = self._buffer, []
+
+            if batch:
+                req = Message.new_request(topic="_metrics_sender", data=batch)
+                self._pipe_handler.send_to_peer(req)
+
+    def _stop_sending(self):
+        self._stop_flush.set()
+        self._data_added.set()
+        flusher, self._flusher = self._flusher, None
+        if flusher:
+            flusher.join()
+
+        with self._buffer_lock:
+            self._stopped = True
+
+        # send what is left in the buffer before the pipe handler stops
+        self._flush()
+
+        with self._send_lock:
+            pipe_handler, self._pipe_handler = self._pipe_handler, None
+        if pipe_handler:
+            # the pipe is closed by the receiving side, which may still be reading the last batch
+            pipe_handler.stop(close_pipe=False)
@@ -219,7 +219,22 @@ class FLModelUtils:
         return FLModelUtils.get_meta_prop(model, MetaKey.CONFIGS)
 
     @staticmethod
-    def update_model(model: FLModel, model_update: FLModel, replace_meta: bool = True) -> FLModel:
+    def update_model(
+        model: FLModel, model_update: FLModel, replace_meta: bool = True, inplace: bool = False
+    ) -> FLModel:
+        """Updates the given FLModel with the model_update.
+
+        Args:
+            model (FLModel): the model to be updated, its params_type must be FULL.
+            model_update (FLModel): the update to apply, either FULL params or DIFF params.
+            replace_meta (bool): whether to replace the meta of the model or merge into it.
+            inplace (bool): whether to add DIFF params into the existing param arrays/tensors of the model
+                instead of allocating new ones. Params whose dtype or shape differ from the update are still
+                added out-of-place. Only set this when the model exclusively owns its params.
+
+        Returns:
+            The updated FLModel.
+        """
         if model.params_type != ParamsType.FULL:
             raise RuntimeError(f"params_type {model.params_type} of `model` not supported! Expected `ParamsType.FULL`.")
 
@@ -234,7 +249,16 @@ class FLModelUtils:
             model.params = model_update.params
         elif model_update.params_type == ParamsType.DIFF:
             for v_name, v_value in model_update.params.items():
-                model.params[v_name] = model.params[v_name] + v_value
+                current_value = model.params[v_name]
+                if (
+                    inplace
+                    and getattr(current_value, "dtype", None) == getattr(v_value, "dtype", None)
+                    and getattr(current_value, "shape", None) == getattr(v_value, "shape", None)
+                ):
+                    current_value += v_value
+                    model.params[v_name] = current_value
+                else:
+                    model.params[v_name] = current_value + v_value
         else:
             raise RuntimeError(f"params_type {model_update.params_type} of `model_update` not supported!")
         return model
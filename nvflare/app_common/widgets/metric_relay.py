@@ -22,7 +22,7 @@ from nvflare.apis.utils.analytix_utils import send_analytic_dxo
 from nvflare.client.config import ConfigKey
 from nvflare.fuel.utils.attributes_exportable import AttributesExportable
 from nvflare.fuel.utils.constants import PipeChannelName
-from nvflare.fuel.utils.pipe.pipe import Message, Pipe
+from nvflare.fuel.utils.pipe.pipe import Message, Pipe, Topic
 from nvflare.fuel.utils.pipe.pipe_handler import PipeHandler
 from nvflare.widgets.widget import Widget
 
@@ -71,20 +71,49 @@ class MetricRelay(Widget, AttributesExportable):
             self.pipe.open(self.pipe_channel_name)
         elif event_type == EventType.BEFORE_TASK_EXECUTION:
             self.pipe_handler.start()
-        elif event_type == EventType.ABOUT_TO_END_RUN:
+        elif event_type == EventType.END_RUN:
+            # stop after ABOUT_TO_END_RUN, when senders such as MetricsSender flush their last metrics
             self.log_info(fl_ctx, "Stopping pipe handler")
             if self.pipe_handler:
-                self.pipe_handler.notify_end("end_of_job")
-                self.pipe_handler.stop()
+                self._stop_pipe_handler()
+
+    def _stop_pipe_handler(self):
+        if self.pipe_handler.asked_to_stop:
+            # already stopped by _pipe_status_cb, which also closed the pipe
+            return
+
+        reader = self.pipe_handler.reader
+        self.pipe_handler.notify_end("end_of_job")
+        self.pipe_handler.stop(close_pipe=False)
+        if reader and reader.is_alive():
+            # let the reader finish relaying the message it is handling, so that the metrics stay in order
+            reader.join()
+
+        # deliver the metrics that were sent right before the end of the run but not read yet
+        msg = self.pipe.receive()
+        while msg:
+            if msg.msg_type == Message.REQUEST and msg.topic not in [
+                Topic.ABORT,
+                Topic.END,
+                Topic.HEARTBEAT,
+                Topic.PEER_GONE,
+            ]:
+                self._pipe_msg_cb(msg)
+            msg = self.pipe.receive()
+        self.pipe.close()
 
     def _pipe_status_cb(self, msg: Message):
         self.logger.info(f"{self.pipe_channel_name} pipe status changed to {msg.topic}")
         self.pipe_handler.stop()
 
     def _pipe_msg_cb(self, msg: Message):
-        if not isinstance(msg.data, DXO):
-            self.logger.error(f"bad metric data: expect DXO but got {type(msg.data)}")
-        send_analytic_dxo(self, msg.data, self._fl_ctx, self._event_type, fire_fed_event=self._fed_event)
+        # MetricsSender sends the metrics in batches
+        records = msg.data if isinstance(msg.data, list) else [msg.data]
+        for record in records:
+            if not isinstance(record, DXO):
+                self.logger.error(f"bad metric data: expect DXO but got {type(record)}")
+                continue
+            send_analytic_dxo(self, record, self._fl_ctx, self._event_type, fire_fed_event=self._fed_event)
 
     def export(self, export_mode: str) -> Tuple[str, dict]:
         pipe_export_class, pipe_export_args = self.pipe.export(export_mode)
@@ -33,6 +33,7 @@ class BaseFedAvg(ModelController):
         num_clients: int = 3,
         num_rounds: int = 5,
         start_round: int = 0,
+        inplace_update: bool = False,
         **kwargs,
     ):
         """The base controller for FedAvg Workflow. *Note*: This class is based on the `ModelController`.
@@ -58,12 +59,17 @@ class BaseFedAvg(ModelController):
             we will remove this argument in next release.
             num_rounds (int, optional): The total number of training rounds. Defaults to 5.
             start_round (int, optional): The starting round number.
+            inplace_update (bool, optional): whether to add DIFF results into the global model's existing
+                param arrays/tensors instead of allocating new ones. Only enable this when nothing else, such as
+                the persistor or a task still sending the model, holds a reference to these params.
+                Defaults to False.
         """
         super().__init__(*args, **kwargs)
 
         self.num_clients = num_clients
         self.num_rounds = num_rounds
         self.start_round = start_round
+        self.inplace_update = inplace_update
 
         self.current_round = None
 
@@ -160,7 +166,7 @@ class BaseFedAvg(ModelController):
         """
         self.event(AppEventType.BEFORE_SHAREABLE_TO_LEARNABLE)
 
-        model = FLModelUtils.update_model(model, aggr_result)
+        model = FLModelUtils.update_model(model, aggr_result, inplace=self.inplace_update)
 
         # persistor uses Learnable format to save model
         ml = make_model_learnable(weights=model.params, meta_props=model.meta)
@@ -93,7 +93,6 @@ class BroadcastAndWait(FLComponent):
     def results_cb(self, client_task: ClientTask, fl_ctx: FLContext):
         client_name = client_task.client.name
         task_name = client_task.task.name
-        print("task_name", task_name)
         self.log_info(fl_ctx, f"Processing {task_name}, {self.task} result from client {client_name}")
         result = client_task.result
         rc = result.get_return_code()
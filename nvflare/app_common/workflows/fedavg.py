@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Optional
+
 from nvflare.fuel.utils.log_utils import center_message
+from nvflare.fuel.utils.validation_utils import check_non_negative_int, check_positive_int
 
 from .base_fedavg import BaseFedAvg
 
@@ -30,9 +33,24 @@ class FedAvg(BaseFedAvg):
         num_clients (int, optional): The number of clients. Defaults to 3.
         num_rounds (int, optional): The total number of training rounds. Defaults to 5.
         start_round (int, optional): The starting round number.
+        min_responses (int, optional): The minimum number of client results needed to finish a round.
+            Together with `train_timeout`, this allows a round to end without waiting for stragglers.
+            If None, results from all sampled clients are needed. Defaults to None.
+        train_timeout (int, optional): Time in seconds to wait for the clients of a round. When it expires,
+            the round is finished with the results received so far. Defaults to 0 (no timeout).
         persistor_id (str, optional): ID of the persistor component. Defaults to "persistor".
     """
 
+    def __init__(self, *args, min_responses: Optional[int] = None, train_timeout: int = 0, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if min_responses is not None:
+            check_positive_int("min_responses", min_responses)
+        check_non_negative_int("train_timeout", train_timeout)
+
+        self.min_responses = min_responses
+        self.train_timeout = train_timeout
+
     def run(self) -> None:
         self.info(center_message("Start FedAvg."))
 
@@ -47,7 +65,9 @@ class FedAvg(BaseFedAvg):
 
             clients = self.sample_clients(self.num_clients)
 
-            results = self.send_model_and_wait(targets=clients, data=model)
+            results = self.send_model_and_wait(
+                targets=clients, data=model, min_responses=self.min_responses, timeout=self.train_timeout
+            )
 
             aggregate_results = self.aggregate(
                 results, aggregate_fn=self.aggregate_fn
@@ -16,9 +16,13 @@ import os
 from abc import abstractmethod
 
 import torch
+from safetensors import safe_open
+from safetensors.torch import load_model as load_safetensors_model
+from safetensors.torch import save_model as save_safetensors_model
 
 from nvflare.apis.signal import Signal
 from nvflare.app_opt.pt.fedproxloss import PTFedProxLoss
+from nvflare.fuel.utils.log_utils import get_obj_logger
 
 
 class PTDittoHelper(object):
@@ -67,32 +71,54 @@ class PTDittoHelper(object):
         self.epoch_global = 0
         self.epoch_of_start_time = 0
         self.best_metric: int = 0
-        self.model_file_path = os.path.join(app_dir, "personalized_model.pt")
-        self.best_model_file_path = os.path.join(app_dir, "best_personalized_model.pt")
+        # personalized models are saved in safetensors format, with epoch and best_metric kept in the file header
+        self.model_file_path = os.path.join(app_dir, "personalized_model.safetensors")
+        self.best_model_file_path = os.path.join(app_dir, "best_personalized_model.safetensors")
+        # checkpoints saved with torch.save before the switch to safetensors, still loaded when resuming
+        self.legacy_model_file_path = os.path.join(app_dir, "personalized_model.pt")
+        self.legacy_best_model_file_path = os.path.join(app_dir, "best_personalized_model.pt")
+        self.logger = get_obj_logger(self)
+
+    @staticmethod
+    def _read_file_metadata(file_path: str) -> dict:
+        with safe_open(file_path, framework="pt") as f:
+            return f.metadata() or {}
 
     def load_model(self, global_weights):
         # load local model from last round's record if model exist,
         # otherwise initialize from global model weights for the first round.
         if os.path.exists(self.model_file_path):
-            model_data = torch.load(self.model_file_path)
+            # safetensors memory-maps the file, so no extra copy of the weights is made before loading
+            load_safetensors_model(self.model, self.model_file_path)
+            self.epoch_of_start_time = int(self._read_file_metadata(self.model_file_path)["epoch"])
+        elif os.path.exists(self.legacy_model_file_path):
+            self.logger.info(f"loading personalized model from legacy checkpoint {self.legacy_model_file_path}")
+            model_data = torch.load(self.legacy_model_file_path)
             self.model.load_state_dict(model_data["model"])
             self.epoch_of_start_time = model_data["epoch"]
         else:
             self.model.load_state_dict(global_weights)
             self.epoch_of_start_time = 0
         if os.path.exists(self.best_model_file_path):
-            model_data = torch.load(self.best_model_file_path)
-            self.best_metric = model_data["best_metric"]
+            self.best_metric = float(self._read_file_metadata(self.best_model_file_path)["best_metric"])
+        elif os.path.exists(self.legacy_best_model_file_path):
+            self.logger.info(f"loading best metric from legacy checkpoint {self.legacy_best_model_file_path}")
+            self.best_metric = torch.load(self.legacy_best_model_file_path)["best_metric"]
 
     def save_model(self, is_best=False):
         # save personalized model locally
-        model_weights = self.model.state_dict()
-        save_dict = {"model": model_weights, "epoch": self.epoch_global}
+        metadata = {"epoch": str(self.epoch_global)}
         if is_best:
-            save_dict.update({"best_metric": self.best_metric})
-            torch.save(save_dict, self.best_model_file_path)
+            # safetensors metadata only holds strings; convert first so that tensor metrics can be read back
+            metadata["best_metric"] = str(float(self.best_metric))
+            file_path = self.best_model_file_path
         else:
-            torch.save(save_dict, self.model_file_path)
+            file_path = self.model_file_path
+
+        # write to a temp file first so that an interrupted save never leaves a partial model behind
+        tmp_file_path = file_path + ".tmp"
+        save_safetensors_model(self.model, tmp_file_path, metadata=metadata)
+        os.replace(tmp_file_path, file_path)
 
     def update_metric_save_model(self, metric):
         self.save_model(is_best=False)
@@ -12,16 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 import torch
+from safetensors.torch import load_file, save_file
 
+from nvflare.apis.fl_constant import FLMetaKey
 from nvflare.app_common.abstract.fl_model import FLModel
+from nvflare.app_common.aggregators.weighted_aggregation_helper import WeightedAggregationHelper
+from nvflare.app_common.app_constant import AppConstants
 from nvflare.app_common.utils.math_utils import parse_compare_criteria
 from nvflare.app_common.workflows.base_fedavg import BaseFedAvg
 from nvflare.app_opt.pt.decomposers import TensorDecomposer
 from nvflare.fuel.utils import fobs
+from nvflare.fuel.utils.validation_utils import check_non_negative_int, check_positive_int
+from nvflare.security.logging import secure_format_exception
+
+
+def _is_safetensors_file(filepath: str) -> bool:
+    return filepath.endswith(".safetensors")
 
 
 class PTFedAvgEarlyStopping(BaseFedAvg):
@@ -33,6 +45,8 @@ class PTFedAvgEarlyStopping(BaseFedAvg):
         task_to_optimize: Optional[str] = "train",
         save_filename: Optional[str] = "FL_global_model.pt",
         initial_model: Optional[FLModel] = None,
+        min_responses: Optional[int] = None,
+        train_timeout: int = 0,
         **kwargs,
     ) -> None:
         """Controller for FedAvg Workflow with Early Stopping and Model Selection.
@@ -40,6 +54,10 @@ class PTFedAvgEarlyStopping(BaseFedAvg):
         Args:
             num_clients (int, optional): The number of clients. Defaults to 3.
             num_rounds (int, optional): The total number of training rounds. Defaults to 5.
+            min_responses (int, optional): The minimum number of client results needed to finish a round.
+                If None, results from all sampled clients are needed. Defaults to None.
+            train_timeout (int, optional): Time in seconds to wait for the clients of a round.
+                Defaults to 0 (never time out).
             stop_cond (str, optional): early stopping condition based on metric. String
                 literal in the format of '\\<key\\> \\<op\\> \\<value\\>' (e.g. "accuracy >= 80")
             patience (int, optional): The number of checks with no improvement after which
@@ -47,10 +65,17 @@ class PTFedAvgEarlyStopping(BaseFedAvg):
                 If stop_condition is None, patience does not apply
             task_to_optimize (str, optional): Specifies whether to optimize the target
                 metric on the training or validation task. Defaults is train.
-            save_filename (str, optional): filename for saving model
+            save_filename (str, optional): filename for saving model. The model is saved with `torch.save`,
+                or in safetensors format if the filename ends with ".safetensors".
             initial_model (nn.Module, optional): initial PyTorch model
         """
         super().__init__(*args, **kwargs)
+        if min_responses is not None:
+            check_positive_int("min_responses", min_responses)
+        check_non_negative_int("train_timeout", train_timeout)
+
+        self.min_responses = min_responses
+        self.train_timeout = train_timeout
         self.patience = patience
         self.task_to_optimize = task_to_optimize
         self.num_fl_rounds_without_improvement: int = 0
@@ -79,38 +104,126 @@ class PTFedAvgEarlyStopping(BaseFedAvg):
         model.start_round = self.start_round
         model.total_rounds = self.num_rounds
 
-        for self.current_round in range(self.start_round, self.start_round + self.num_rounds):
-            self.info(f"Round {self.current_round} started.")
-            model.current_round = self.current_round
+        # saving the best model is done in the background so that it overlaps with the next round of training
+        save_future = None
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="model_saver") as save_pool:
+            for self.current_round in range(self.start_round, self.start_round + self.num_rounds):
+                self.info(f"Round {self.current_round} started.")
+                model.current_round = self.current_round
+
+                clients = self.sample_clients(self.num_clients)
+
+                results: List[FLModel] = self.send_model_and_wait(
+                    task_name=self.task_to_optimize,
+                    targets=clients,
+                    data=model,
+                    min_responses=self.min_responses,
+                    timeout=self.train_timeout,
+                )
+
+                # using default aggregate_fn with `WeightedAggregationHelper`.
+                # Can overwrite self.aggregate_fn with signature Callable[List[FLModel], FLModel]
+                aggregate_results = self.aggregate(results, aggregate_fn=self.aggregate_fn)
+
+                # the params of the model may be updated in place, so the previous save must be done first
+                self._wait_for_save(save_future)
+                model = self.update_model(model, aggregate_results)
+
+                self.info(f"Round {self.current_round} global metrics: {model.metrics}")
+
+                if self.is_curr_model_better(model):
+                    self.info("New best model found")
+                    # save a shallow copy since save_model temporarily resets the params of the model it saves
+                    save_future = save_pool.submit(
+                        self.save_model, copy.copy(model), os.path.join(os.getcwd(), self.save_filename)
+                    )
+                else:
+                    if self.patience:
+                        self.info(
+                            f"No metric improvement, num of FL rounds without improvement: "
+                            f"{self.num_fl_rounds_without_improvement}"
+                        )
 
-            clients = self.sample_clients(self.num_clients)
+                if self.should_stop(model.metrics):
+                    self.info(f"Stopping at round={self.current_round} out of total_rounds={self.num_rounds}.")
+                    break
 
-            results: List[FLModel] = self.send_model_and_wait(
-                task_name=self.task_to_optimize, targets=clients, data=model
-            )
+            self._wait_for_save(save_future)
 
-            # using default aggregate_fn with `WeightedAggregationHelper`.
-            # Can overwrite self.aggregate_fn with signature Callable[List[FLModel], FLModel]
-            aggregate_results = self.aggregate(results, aggregate_fn=self.aggregate_fn)
-            model = self.update_model(model, aggregate_results)
+        self.info("Finished FedAvg.")
 
-            self.info(f"Round {self.current_round} global metrics: {model.metrics}")
+    @staticmethod
+    def aggregate_fn(results: List[FLModel]) -> FLModel:
+        """Weighted average of the PyTorch params of the results.
 
-            if self.is_curr_model_better(model):
-                self.info("New best model found")
-                self.save_model(model, os.path.join(os.getcwd(), self.save_filename))
-            else:
-                if self.patience:
-                    self.info(
-                        f"No metric improvement, num of FL rounds without improvement: "
-                        f"{self.num_fl_rounds_without_improvement}"
-                    )
+        Params of the same dtype and device are flattened into one buffer per site, so that the weighted average
+        of each group is computed with a single matrix-vector product instead of one accumulation per param and site.
+        Falls back to the default aggregation if the params are not all PyTorch tensors with the same keys.
 
-            if self.should_stop(model.metrics):
-                self.info(f"Stopping at round={self.current_round} out of total_rounds={self.num_rounds}.")
-                break
+        Args:
+            results (List[FLModel]): training results of the clients.
 
-        self.info("Finished FedAvg.")
+        Returns:
+            The aggregated FLModel.
+        """
+        if not results:
+            raise ValueError("received empty results for aggregation.")
+
+        keys = results[0].params.keys()
+        for _result in results:
+            if _result.params.keys() != keys or not all(isinstance(v, torch.Tensor) for v in _result.params.values()):
+                return BaseFedAvg.aggregate_fn(results)
+
+        weights = [_result.meta.get(FLMetaKey.NUM_STEPS_CURRENT_ROUND, 1.0) for _result in results]
+        norm_weights = torch.tensor(weights, dtype=torch.float64)
+        norm_weights = norm_weights / norm_weights.sum()
+
+        # integer buffers (e.g. num_batches_tracked) are averaged as floats, same as the default aggregation
+        groups = {}
+        for k, v in results[0].params.items():
+            dtype = v.dtype if v.is_floating_point() else torch.get_default_dtype()
+            groups.setdefault((dtype, v.device), []).append(k)
+
+        aggr_params = {}
+        for (dtype, device), group_keys in groups.items():
+            flat = torch.stack(
+                [torch.cat([_result.params[k].reshape(-1).to(dtype) for k in group_keys]) for _result in results]
+            )
+            aggr_flat = torch.mv(flat.t(), norm_weights.to(dtype=dtype, device=device))
+
+            # clone the pieces so that the aggregated params do not share one storage
+            shapes = [results[0].params[k].shape for k in group_keys]
+            pieces = aggr_flat.split([shape.numel() for shape in shapes])
+            for k, shape, piece in zip(group_keys, shapes, pieces):
+                aggr_params[k] = piece.reshape(shape).clone()
+
+        aggr_metrics = None
+        if all(_result.metrics for _result in results):
+            aggr_metrics_helper = WeightedAggregationHelper()
+            for _result, weight in zip(results, weights):
+                aggr_metrics_helper.add(
+                    data=_result.metrics,
+                    weight=weight,
+                    contributor_name=_result.meta.get("client_name", AppConstants.CLIENT_UNKNOWN),
+                    contribution_round=_result.current_round,
+                )
+            aggr_metrics = aggr_metrics_helper.get_result()
+
+        return FLModel(
+            params=aggr_params,
+            params_type=results[0].params_type,
+            metrics=aggr_metrics,
+            meta={"nr_aggregated": len(results), "current_round": results[0].current_round},
+        )
+
+    def _wait_for_save(self, save_future) -> None:
+        if save_future is None:
+            return
+
+        try:
+            save_future.result()
+        except Exception as e:
+            self.exception(f"Failed to save the best model: {secure_format_exception(e)}")
 
     def should_stop(self, metrics: Optional[Dict] = None) -> bool:
         """Checks whether the current FL experiment should stop.
@@ -181,8 +294,13 @@ class PTFedAvgEarlyStopping(BaseFedAvg):
             filepath (str, optional): location where the model will be saved
         """
         params = model.params
-        # PyTorch save
-        torch.save(params, filepath)
+        if _is_safetensors_file(filepath):
+            if not all(isinstance(v, torch.Tensor) for v in params.values()):
+                raise ValueError(f"cannot save {filepath} in safetensors format: all params must be torch tensors")
+            # safetensors writes the raw tensor bytes without pickling
+            save_file({k: v.contiguous() for k, v in params.items()}, filepath)
+        else:
+            torch.save(params, filepath)
 
         # save FLModel metadata
         model.params = {}
@@ -195,8 +313,11 @@ class PTFedAvgEarlyStopping(BaseFedAvg):
         Args:
             filepath (str, optional): location of the saved model to load
         """
-        # PyTorch load
-        params = torch.load(filepath)
+        if _is_safetensors_file(filepath):
+            # safetensors memory-maps the file instead of unpickling it
+            params = load_file(filepath)
+        else:
+            params = torch.load(filepath)
 
         # load FLModel metadata
         model: FLModel = fobs.loadf(f"{filepath}.metadata")
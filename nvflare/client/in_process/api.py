@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import os
-import time
+import threading
 from typing import Any, Dict, Optional
 
 from nvflare.apis.analytix import AnalyticsDataType
@@ -42,7 +42,7 @@ class InProcessClientAPI(APISpec):
 
         Args:
             task_metadata (dict): task metadata, added to client_config.
-            result_check_interval (float): how often to check if result is available.
+            result_check_interval (float): max time to wait for a result before re-checking the job status.
         """
         self.data_bus = DataBus()
         self.data_bus.subscribe([TOPIC_GLOBAL_RESULT], self.__receive_callback)
@@ -62,6 +62,7 @@ class InProcessClientAPI(APISpec):
         self.stop = False
         self.rank = None
         self.receive_called = False  # to check if users have call received for a new model
+        self._state_changed = threading.Event()  # set when a global model arrives or the job is stopped/aborted
 
     def init(self, rank: Optional[str] = None, config: Optional[Dict] = None):
         """Initializes NVFlare Client API environment.
@@ -112,8 +113,9 @@ class InProcessClientAPI(APISpec):
                 break
 
             if self.fl_model is None:
-                self.logger.debug(f"no result global message available, sleep {self.result_check_interval} sec")
-                time.sleep(self.result_check_interval)
+                self.logger.debug(f"no result global message available, wait up to {self.result_check_interval} sec")
+                self._state_changed.wait(self.result_check_interval)
+                self._state_changed.clear()
             else:
                 break
 
@@ -214,6 +216,7 @@ class InProcessClientAPI(APISpec):
 
         fl_model = FLModelUtils.from_shareable(data)
         self.fl_model = fl_model
+        self._state_changed.set()
 
     def __ask_to_abort(self, topic, msg, databus):
         if topic == TOPIC_ABORT:
@@ -224,6 +227,7 @@ class InProcessClientAPI(APISpec):
             self.stop = True
             self.stop_reason = msg
             self.logger.warning(f"ask to stop job: reason: {msg}")
+        self._state_changed.set()
 
     def __continue_job(self) -> bool:
         if self.abort:
@@ -239,3 +243,4 @@ class InProcessClientAPI(APISpec):
         self.stop = True
         self.event_manager.fire_event(TOPIC_STOP)
         self.stop_reason = "API shutdown called."
+        self._state_changed.set()
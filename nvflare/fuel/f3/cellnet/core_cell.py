@@ -19,6 +19,7 @@ import random
 import threading
 import time
 import uuid
+from collections import deque
 from typing import Dict, List, Tuple, Union
 from urllib.parse import urlparse
 
@@ -381,7 +382,7 @@ class CoreCell(MessageReceiver, EndpointMonitor):
         self.bulk_checker = None
         self.bulk_senders = {}
         self.bulk_process_interval = bulk_process_interval
-        self.bulk_messages = []
+        self.bulk_messages = deque()
         self.bulk_processor = None
         self.bulk_lock = threading.Lock()
         self.bulk_msg_lock = threading.Lock()
@@ -1524,7 +1525,7 @@ class CoreCell(MessageReceiver, EndpointMonitor):
             with self.bulk_msg_lock:
                 if not self.bulk_messages:
                     return
-                bulk = self.bulk_messages.pop(0)
+                bulk = self.bulk_messages.popleft()
             self._process_one_bulk(bulk)
 
     def _process_one_bulk(self, bulk_request: Message):
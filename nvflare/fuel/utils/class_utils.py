@@ -14,6 +14,7 @@
 import importlib
 import inspect
 import pkgutil
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from nvflare.apis.fl_component import FLComponent
@@ -140,7 +141,12 @@ def get_component_init_parameters(component):
     Returns:
 
     """
-    class__ = component.__class__
+    # the parameters only depend on the class, return a copy so that the cached parameters are not modified
+    return dict(_get_class_init_parameters(component.__class__))
+
+
+@lru_cache(maxsize=512)
+def _get_class_init_parameters(class__) -> Dict:
     parameters = {}
     _retrieve_parameters(class__, parameters)
     return parameters
@@ -115,6 +115,8 @@ class PipeHandler(object):
         self._pause = False
         self._last_heartbeat_received_time = None
         self._check_interval = 0.01
+        self._heartbeat_wakeup = threading.Event()
+        self._reader_wakeup = threading.Event()
         self.heartbeat_sender = threading.Thread(target=self._heartbeat)
         self.heartbeat_sender.daemon = True
 
@@ -247,6 +249,8 @@ class PipeHandler(object):
             close_pipe: whether to close the monitored pipe.
         """
         self.asked_to_stop = True
+        self._heartbeat_wakeup.set()
+        self._reader_wakeup.set()
         self.peer_is_up_or_dead.clear()
         pipe = self.pipe
         self.pipe = None
@@ -322,8 +326,14 @@ class PipeHandler(object):
 
     def _try_read(self):
         self._last_heartbeat_received_time = time.time()
+        msg_received = False
         while not self.asked_to_stop:
-            time.sleep(self.read_interval)
+            # while messages are arriving, keep reading until the pipe is drained instead of
+            # reading one message per read_interval.
+            if not msg_received:
+                # return from the wait right away when stopped, so that the reader can be joined
+                self._reader_wakeup.wait(self.read_interval)
+            msg_received = False
             if self._pause:
                 continue
 
@@ -339,6 +349,7 @@ class PipeHandler(object):
             now = time.time()
 
             if msg:
+                msg_received = True
                 self._last_heartbeat_received_time = now
                 # if receive any messages even if Topic is END or ABORT or PEER_GONE
                 #    we still set peer_is_up_or_dead, as we no longer need to wait
@@ -372,16 +383,20 @@ class PipeHandler(object):
         last_heartbeat_sent_time = 0.0
         while not self.asked_to_stop:
             if self._pause:
-                time.sleep(self._check_interval)
-                continue
-            now = time.time()
-
-            # send heartbeat to the peer
-            if now - last_heartbeat_sent_time > self.heartbeat_interval:
-                self.send_to_peer(self._make_event_message(Topic.HEARTBEAT, ""))
-                last_heartbeat_sent_time = now
-
-            time.sleep(self._check_interval)
+                wait_time = self.heartbeat_interval
+            else:
+                now = time.time()
+
+                # send heartbeat to the peer
+                if now - last_heartbeat_sent_time > self.heartbeat_interval:
+                    self.send_to_peer(self._make_event_message(Topic.HEARTBEAT, ""))
+                    last_heartbeat_sent_time = now
+                wait_time = last_heartbeat_sent_time + self.heartbeat_interval - time.time()
+
+            # sleep until the next heartbeat is due, but wake up right away when stopped or resumed.
+            # the flags are checked again after the wait, so clearing the event does not lose a wakeup.
+            self._heartbeat_wakeup.wait(max(wait_time, self._check_interval))
+            self._heartbeat_wakeup.clear()
         self.heartbeat_sender = None
 
     def get_next(self) -> Optional[Message]:
@@ -409,3 +424,4 @@ class PipeHandler(object):
         if self._pause:
             self._pause = False
             self._last_heartbeat_received_time = time.time()
+            self._heartbeat_wakeup.set()
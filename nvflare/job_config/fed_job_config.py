@@ -146,11 +146,13 @@ class FedJobConfig:
 
         """
         job_dir = os.path.join(job_root, self.job_name)
-        if os.path.exists(job_dir):
+        # an empty job folder is simply reused
+        if os.path.exists(job_dir) and not self._is_empty_folder(job_dir):
             if self._is_valid_job_folder(job_dir):
                 shutil.rmtree(job_dir, ignore_errors=True)
             else:
                 raise RuntimeError(f"Job folder {job_dir} already exists and is not a valid job folder.")
+        os.makedirs(job_dir, exist_ok=True)
 
         for app_name, fed_app in self.fed_apps.items():
             self.custom_modules = []
@@ -285,8 +287,9 @@ class FedJobConfig:
 
     def _get_custom_file(self, custom_dir, module, source_file):
         package = module.split(".")[0]
-        if os.path.exists(source_file):
-            if package not in FL_PACKAGES and package not in self.app_packages and module not in self.custom_modules:
+        # check the in-memory conditions before the file system, most components are not custom code
+        if package not in FL_PACKAGES and package not in self.app_packages and module not in self.custom_modules:
+            if os.path.exists(source_file):
                 module_path = module.replace(".", os.sep)
                 if module_path in source_file:
                     index = source_file.rindex(module_path)
@@ -471,8 +474,7 @@ class FedJobConfig:
     def _get_deploy_map(self):
         deploy_map = {}
         for site, app_name in self.deploy_map.items():
-            deploy_map[app_name] = deploy_map.get(app_name, [])
-            deploy_map[app_name].append(site)
+            deploy_map.setdefault(app_name, []).append(site)
         return deploy_map
 
     def _trim_whitespace(self, string: str):
@@ -485,3 +487,10 @@ class FedJobConfig:
     def _is_valid_job_folder(job_folder: str) -> bool:
         meta_file = os.path.join(job_folder, META_JSON)
         return os.path.exists(meta_file)
+
+    @staticmethod
+    def _is_empty_folder(folder: str) -> bool:
+        if not os.path.isdir(folder):
+            return False
+        with os.scandir(folder) as it:
+            return next(it, None) is None
@@ -14,6 +14,7 @@
 import dataclasses
 import inspect
 import os.path
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pyhocon import ConfigFactory as CF
@@ -33,6 +34,25 @@ class KeyIndex:
     component_name: Optional[str] = None
 
 
+def _get_init_parameters(class_path: str, class_name: str) -> Optional[Tuple[inspect.Parameter, ...]]:
+    try:
+        return _import_init_parameters(class_path, class_name)
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _import_init_parameters(class_path: str, class_name: str) -> Tuple[inspect.Parameter, ...]:
+    # importing the class and inspecting its constructor is slow and the result never changes,
+    # so it is only done once for each class even if the class is used by many components.
+    # a failed import raises instead of returning, so it is not cached and is tried again next time,
+    # e.g. after a custom folder is added to sys.path.
+    module, import_flag = optional_import(module=class_path, name=class_name)
+    if not import_flag:
+        raise ImportError(f"cannot import {class_name} from {class_path}")
+    return tuple(inspect.signature(module.__init__).parameters.values())
+
+
 def build_reverse_order_index(input_config_file_path: str) -> Tuple[str, ConfigTree, List[str], Dict]:
     # use pyhocon to load config
     config_dir = os.path.dirname(input_config_file_path)
@@ -241,13 +261,12 @@ def add_class_defaults_to_key(excluded_keys, key_index, key_indices, results):
     last_dot_index = value.rindex(".")
     class_path = value[:last_dot_index]
     class_name = value[last_dot_index + 1 :]
-    module, import_flag = optional_import(module=class_path, name=class_name)
-    if import_flag:
-        params = inspect.signature(module.__init__).parameters
+    params = _get_init_parameters(class_path, class_name)
+    if params is not None:
         args_config = None
         if parent_key and parent_key.value and isinstance(parent_key.value, ConfigTree):
             args_config = parent_key.value.get("args", None)
-        for v in params.values():
+        for v in params:
             if (
                 v.name != "self"
                 and v.default is not None
@@ -423,10 +423,11 @@ def build_config_file_indices(job_folder: str, app_names: List[str]) -> Dict[str
             break
 
     for app_name in app_names:
-        app_dir = os.path.join(job_folder, app_name)
+        # resolve the config dir once per app rather than once per candidate file
+        app_config_dir = os.path.abspath(os.path.join(job_folder, app_name, APP_CONFIG_DIR))
         for ext in config_extensions:
             for base in config_included:
-                file = os.path.abspath(os.path.join(app_dir, APP_CONFIG_DIR, f"{base}{ext}"))
+                file = os.path.join(app_config_dir, f"{base}{ext}")
                 if os.path.isfile(file):
                     config_files = app_config_files.get(app_name, [])
                     config_files.append(file)
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import os
 import shutil
 import traceback
+from functools import lru_cache
 from tempfile import mkdtemp
 from typing import List, Optional, Tuple
 
@@ -193,9 +195,14 @@ def get_src_template(cmd_args) -> Optional[str]:
 def remove_pycache_files(custom_dir):
     for root, dirs, _files in os.walk(custom_dir):
         # remove pycache and pyc files
+        kept_dirs = []
         for d in dirs:
             if d == "__pycache__" or d.endswith(".pyc"):
                 shutil.rmtree(os.path.join(root, d))
+            else:
+                kept_dirs.append(d)
+        # do not walk into the removed dirs
+        dirs[:] = kept_dirs
 
 
 def remove_extra_files(config_dir):
@@ -609,11 +616,17 @@ def prepare_meta_config(cmd_args, target_template_dir, app_names):
                 os.remove(meta_path)
 
 
-def load_default_config_template(config_file_name: str):
+@lru_cache(maxsize=None)
+def _parse_default_config_template(config_file_name: str) -> ConfigTree:
     file_dir = os.path.dirname(__file__)
     # src config here is always pyhocon
-    config_template = CF.parse_file(os.path.join(file_dir, f"config/{config_file_name}"))
-    return config_template
+    return CF.parse_file(os.path.join(file_dir, f"config/{config_file_name}"))
+
+
+def load_default_config_template(config_file_name: str):
+    # the templates are package resources that never change, so each one is only parsed once.
+    # callers modify the returned config, hence a copy of the cached config is returned.
+    return copy.deepcopy(_parse_default_config_template(config_file_name))
 
 
 def dst_app_path(job_folder: str, app_name="app"):
@@ -703,7 +716,14 @@ def prepare_app_scripts(job_folder, app_custom_dirs, cmd_args):
             if os.path.exists(script_dir):
                 if script_dir == job_folder or is_subdir(job_folder, script_dir):
                     raise ValueError("job_folder must not be the same or sub directory of script_dir")
-                shutil.copytree(cmd_args.script_dir, app_custom_dir, dirs_exist_ok=True)
+                # skip pycache while copying, so that it is not copied only to be removed again
+                shutil.copytree(
+                    cmd_args.script_dir,
+                    app_custom_dir,
+                    dirs_exist_ok=True,
+                    ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+                )
+                # the custom dir may already hold pycache from an earlier run, e.g. when re-creating the job
                 remove_pycache_files(app_custom_dir)
             else:
                 raise ValueError(f"{cmd_args.script_dir} doesn't exists")
@@ -14,6 +14,7 @@
 
 import threading
 import time
+from collections import deque
 
 from nvflare.apis.client_engine_spec import ClientEngineSpec
 from nvflare.apis.event_type import EventType
@@ -27,7 +28,7 @@ FED_EVENT_TOPIC = "fed.event"
 
 
 class FedEventRunner(Widget):
-    def __init__(self, topic=FED_EVENT_TOPIC, regular_interval=0.01, grace_period=2.0, queue_empty_period=2.0):
+    def __init__(self, topic=FED_EVENT_TOPIC, regular_interval=0.1, grace_period=2.0, queue_empty_period=2.0):
         """Init FedEventRunner.
 
         The FedEventRunner handles posting and receiving of fed events.
@@ -36,6 +37,8 @@ class FedEventRunner(Widget):
 
         Args:
             topic: the fed event topic to be handled. Defaults to 'fed.event'
+            regular_interval: max time to wait for new incoming events before checking the abort signal again.
+                Incoming events wake up the poster immediately. Defaults to 0.1 seconds.
         """
         Widget.__init__(self)
         self.topic = topic
@@ -46,8 +49,9 @@ class FedEventRunner(Widget):
         self.queue_empty_period = queue_empty_period
         self.engine = None
         self.last_timestamps = {}  # client name => last_timestamp
-        self.in_events = []
+        self.in_events = deque()
         self.in_lock = threading.Lock()
+        self.in_event_added = threading.Event()  # wakes up the poster thread when there is work to do
         self.last_queue_empty_time = time.time()  # last time when the in_events queue became empty
         self.poster = None
 
@@ -59,6 +63,7 @@ class FedEventRunner(Widget):
             self.asked_to_stop = False
         elif event_type == EventType.END_RUN:
             self.asked_to_stop = True
+            self.in_event_added.set()
             if self.poster is not None and self.poster.is_alive():
                 self.poster.join()
         elif event_type == EventType.CHECK_END_RUN_READINESS:
@@ -129,6 +134,7 @@ class FedEventRunner(Widget):
                 request.set_header(FedEventHeader.DIRECTION, "in")
                 self.in_events.append(request)
                 self.last_timestamps[peer_name] = timestamp
+                self.in_event_added.set()
 
         # NOTE: we do not fire event here since event process could take time.
         # Instead, we simply add the package to the queue and return quickly.
@@ -150,14 +156,17 @@ class FedEventRunner(Widget):
         """
         sleep_time = self.regular_interval
         while True:
-            time.sleep(sleep_time)
+            # wait until a new event is received or END_RUN is fired, instead of sleeping a fixed time.
+            # The flag must be cleared before checking the queue so that no wakeup is lost.
+            self.in_event_added.wait(sleep_time)
+            self.in_event_added.clear()
             if self.abort_signal.triggered:
                 break
             n = len(self.in_events)
             if n > 0:
                 sleep_time = 0.0
                 with self.in_lock:
-                    event_to_post = self.in_events.pop(0)
+                    event_to_post = self.in_events.popleft()
                     if len(self.in_events) == 0:
                         self.last_queue_empty_time = time.time()
             elif self.asked_to_stop:
@@ -187,7 +196,7 @@ class FedEventRunner(Widget):
 
 
 class ServerFedEventRunner(FedEventRunner):
-    def __init__(self, topic=FED_EVENT_TOPIC, regular_interval=0.01, grace_period=2.0, queue_empty_period=2.0):
+    def __init__(self, topic=FED_EVENT_TOPIC, regular_interval=0.1, grace_period=2.0, queue_empty_period=2.0):
         """Init ServerFedEventRunner."""
         FedEventRunner.__init__(self, topic, regular_interval, grace_period, queue_empty_period)
 
@@ -85,6 +85,32 @@ class TestAnalytix:
         assert result.step == step
         assert result.sender == LogWriterName.TORCH_TB
 
+    def test_no_instance_dict(self):
+        data = AnalyticsData(key="loss", value=1.0, data_type=AnalyticsDataType.SCALAR, global_step=1)
+
+        assert not hasattr(data, "__dict__")
+        assert data.step == 1
+        assert data.path is None
+
+    def test_from_dxo_does_not_modify_dxo(self):
+        kwargs = {"path": "/tmp/log"}
+        dxo = DXO(
+            data_kind=DataKind.ANALYTIC,
+            data={
+                TrackConst.TRACK_KEY: "loss",
+                TrackConst.TRACK_VALUE: 1.0,
+                TrackConst.GLOBAL_STEP_KEY: 3,
+                TrackConst.KWARGS_KEY: kwargs,
+            },
+        )
+        dxo.set_meta_prop(TrackConst.DATA_TYPE_KEY, AnalyticsDataType.SCALAR)
+
+        result = AnalyticsData.from_dxo(dxo)
+
+        assert result.step == 3
+        assert result.kwargs == {"path": "/tmp/log", TrackConst.GLOBAL_STEP_KEY: 3}
+        assert kwargs == {"path": "/tmp/log"}
+
     @pytest.mark.parametrize("data", TO_DXO_TEST_CASES)
     def test_to_dxo(self, data: AnalyticsData):
         result = data.to_dxo()
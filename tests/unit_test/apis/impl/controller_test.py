@@ -2193,3 +2193,15 @@ class TestSendBehavior(TestController):
         assert task.completion_status == TaskCompletionStatus.OK
         launch_thread.join()
         self.teardown_system(controller, fl_ctx)
+
+
+class TestWaitForTask:
+    def test_wait_for_task_wakes_up_when_task_done(self):
+        communicator = WFCommServer(task_check_period=30.0)
+        task = create_task("__test_task")
+        # task_done_cb is wrapped by wait_for_task, so look it up when the timer fires
+        threading.Timer(0.1, lambda: task.task_done_cb(task=task, fl_ctx=None)).start()
+
+        start = time.time()
+        communicator.wait_for_task(task, Signal())
+        assert time.time() - start < 5.0
@@ -0,0 +1,86 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from nvflare.app_common.aggregators.weighted_aggregation_helper import WeightedAggregationHelper
+
+
+class TestWeightedAggregationHelper:
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_weighted_average(self, dtype):
+        helper = WeightedAggregationHelper()
+        data = [np.full(4, i + 1, dtype=dtype) for i in range(3)]
+        weights = [1.0, 2.0, 3.0]
+        for i, (d, w) in enumerate(zip(data, weights)):
+            helper.add(data={"w": d, "loss": float(i)}, weight=w, contributor_name=f"site-{i}", contribution_round=0)
+
+        result = helper.get_result()
+
+        np.testing.assert_allclose(result["w"], np.full(4, 14.0 / 6.0), rtol=1e-6)
+        assert result["w"].dtype == dtype
+        assert result["loss"] == pytest.approx(8.0 / 6.0)
+        assert helper.get_len() == 0
+
+    def test_contributed_data_not_modified(self):
+        helper = WeightedAggregationHelper()
+        data = [np.ones(3, dtype=np.float32), np.full(3, 3.0, dtype=np.float32)]
+        for i, d in enumerate(data):
+            helper.add(data={"w": d}, weight=1.0, contributor_name=f"site-{i}", contribution_round=0)
+
+        result = helper.get_result()
+
+        np.testing.assert_array_equal(result["w"], np.full(3, 2.0))
+        np.testing.assert_array_equal(data[0], np.ones(3))
+        np.testing.assert_array_equal(data[1], np.full(3, 3.0))
+
+    def test_without_weigh_by_local_iter(self):
+        helper = WeightedAggregationHelper(weigh_by_local_iter=False)
+        data = [np.ones(3), np.full(3, 3.0)]
+        for i, d in enumerate(data):
+            helper.add(data={"w": d}, weight=2.0, contributor_name=f"site-{i}", contribution_round=0)
+
+        result = helper.get_result()
+
+        np.testing.assert_array_equal(result["w"], np.ones(3))
+        np.testing.assert_array_equal(data[0], np.ones(3))
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_numpy_scalars(self, dtype):
+        helper = WeightedAggregationHelper()
+        for i, v in enumerate([1.0, 2.0, 6.0]):
+            helper.add(data={"auc": dtype(v)}, weight=1.0, contributor_name=f"site-{i}", contribution_round=0)
+
+        result = helper.get_result()
+
+        assert result["auc"] == pytest.approx(3.0)
+
+    def test_mixed_dtypes(self):
+        helper = WeightedAggregationHelper()
+        helper.add(data={"w": np.ones(3, dtype=np.float32)}, weight=1.0, contributor_name="a", contribution_round=0)
+        helper.add(data={"w": np.full(3, 3.0)}, weight=1.0, contributor_name="b", contribution_round=0)
+
+        result = helper.get_result()
+
+        assert result["w"].dtype == np.float64
+        np.testing.assert_array_equal(result["w"], np.full(3, 2.0))
+
+    def test_exclude_vars(self):
+        helper = WeightedAggregationHelper(exclude_vars="bias")
+        helper.add(data={"w": np.ones(2), "bias": np.ones(2)}, weight=1.0, contributor_name="a", contribution_round=0)
+
+        result = helper.get_result()
+
+        assert "bias" not in result
@@ -0,0 +1,80 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from nvflare.apis.fl_constant import ReturnCode
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.shareable import Shareable
+from nvflare.apis.signal import Signal
+from nvflare.app_common.executors.in_process_client_api_executor import InProcessClientAPIExecutor
+from nvflare.client.in_process.api import TOPIC_ABORT, TOPIC_LOCAL_RESULT
+
+
+def _create_executor(result_pull_interval: float) -> InProcessClientAPIExecutor:
+    executor = InProcessClientAPIExecutor(task_script_path="train.py", result_pull_interval=result_pull_interval)
+    executor._client_api = Mock()
+    executor.send_data_to_peer = Mock()
+    return executor
+
+
+class TestInProcessClientAPIExecutor:
+    def test_execute_returns_when_result_received(self):
+        # the result must be picked up right away, not after the pull interval
+        executor = _create_executor(result_pull_interval=30.0)
+        result = Shareable()
+        result["value"] = 1
+
+        timer = threading.Timer(0.2, executor.local_result_callback, args=(TOPIC_LOCAL_RESULT, result, None))
+        start = time.time()
+        timer.start()
+        reply = executor.execute("train", Shareable(), FLContext(), Signal())
+        timer.join()
+
+        assert time.time() - start < 10.0
+        assert reply["value"] == 1
+        assert executor.local_result is None
+
+    def test_execute_aborted(self):
+        executor = _create_executor(result_pull_interval=0.1)
+        abort_signal = Signal()
+        abort_signal.trigger("abort")
+
+        reply = executor.execute("train", Shareable(), FLContext(), abort_signal)
+
+        assert reply.get_return_code() == ReturnCode.TASK_ABORTED
+
+    def test_execute_returns_when_aborted_by_peer(self):
+        executor = _create_executor(result_pull_interval=30.0)
+
+        timer = threading.Timer(0.2, executor.to_abort_callback, args=(TOPIC_ABORT, "abort", None))
+        start = time.time()
+        timer.start()
+        reply = executor.execute("train", Shareable(), FLContext(), Signal())
+        timer.join()
+
+        assert time.time() - start < 10.0
+        assert reply.get_return_code() == ReturnCode.TASK_ABORTED
+
+    def test_bad_local_result(self):
+        executor = _create_executor(result_pull_interval=0.1)
+
+        with pytest.raises(ValueError, match="expect Shareable"):
+            executor.local_result_callback(TOPIC_LOCAL_RESULT, {"value": 1}, None)
+
+        assert executor.local_result is None
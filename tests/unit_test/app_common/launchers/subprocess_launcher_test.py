@@ -14,8 +14,10 @@
 
 import shutil
 import tempfile
+from unittest.mock import Mock
 
 from nvflare.apis.dxo import DXO, DataKind
+from nvflare.apis.fl_constant import FLContextKey
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.signal import Signal
 from nvflare.app_common.launchers.subprocess_launcher import SubprocessLauncher
@@ -50,3 +52,24 @@ class TestSubprocessLauncher:
 
         assert launcher._process is None
         shutil.rmtree(tempdir)
+
+    def test_env_built_once(self):
+        tempdir = tempfile.mkdtemp()
+        workspace = Mock()
+        workspace.get_app_custom_dir.return_value = tempdir
+        fl_ctx = FLContext()
+        fl_ctx.set_prop(FLContextKey.WORKSPACE_OBJECT, workspace)
+        fl_ctx.set_prop(FLContextKey.CURRENT_JOB_ID, "test_job")
+        launcher = SubprocessLauncher("echo 'test'", launch_once=False)
+        launcher._app_dir = tempdir
+
+        signal = Signal()
+        task_name = "__test_task"
+        dxo = DXO(DataKind.WEIGHTS, {})
+        for _ in range(2):
+            assert launcher.launch_task(task_name, dxo.to_shareable(), fl_ctx, signal) is True
+            launcher.stop_task(task_name, fl_ctx, signal)
+
+        assert workspace.get_app_custom_dir.call_count == 1
+        assert launcher._env["CLIENT_API_TYPE"] == "EX_PROCESS_API"
+        shutil.rmtree(tempdir)
@@ -0,0 +1,178 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from unittest.mock import Mock
+
+from nvflare.apis.analytix import AnalyticsDataType
+from nvflare.apis.dxo import DXO
+from nvflare.apis.event_type import EventType
+from nvflare.apis.fl_constant import ReservedKey
+from nvflare.apis.fl_context import FLContext
+from nvflare.app_common.metrics_exchange.metrics_sender import MetricsSender
+from nvflare.app_common.widgets.metric_relay import MetricRelay
+from nvflare.fuel.utils.constants import Mode
+from nvflare.fuel.utils.pipe.memory_pipe import MemoryPipe
+from nvflare.fuel.utils.pipe.pipe import Message
+
+
+class TestMetricsSender:
+    def test_metrics_sent_in_one_batch(self):
+        sender = MetricsSender()
+        sender._pipe_handler = Mock()
+
+        for i in range(5):
+            sender.add(tag="loss", value=float(i), data_type=AnalyticsDataType.SCALAR, global_step=i)
+        sender.handle_event(EventType.ABOUT_TO_END_RUN, FLContext())
+
+        sender._pipe_handler.send_to_peer.assert_called_once()
+        msg = sender._pipe_handler.send_to_peer.call_args[0][0]
+        assert [dxo.data["track_value"] for dxo in msg.data] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert sender._buffer == []
+
+    def test_empty_buffer_not_sent(self):
+        sender = MetricsSender()
+        sender._pipe_handler = Mock()
+
+        sender.handle_event(EventType.ABOUT_TO_END_RUN, FLContext())
+
+        sender._pipe_handler.send_to_peer.assert_not_called()
+
+    def test_buffer_flushed_on_abort_task(self):
+        sender = MetricsSender()
+        sender._pipe_handler = Mock()
+
+        sender.add(tag="loss", value=1.0, data_type=AnalyticsDataType.SCALAR)
+        sender.handle_event(EventType.ABORT_TASK, FLContext())
+
+        sender._pipe_handler.send_to_peer.assert_called_once()
+        assert sender._buffer == []
+
+    def test_buffer_kept_without_pipe_handler(self):
+        sender = MetricsSender()
+
+        sender.add(tag="loss", value=1.0, data_type=AnalyticsDataType.SCALAR)
+        sender.handle_event(EventType.ABORT_TASK, FLContext())
+
+        assert len(sender._buffer) == 1
+
+    def test_add_after_end_of_run_rejected(self):
+        sender = MetricsSender()
+        sender._pipe_handler = Mock()
+        sender.handle_event(EventType.ABOUT_TO_END_RUN, FLContext())
+
+        sender.add(tag="loss", value=1.0, data_type=AnalyticsDataType.SCALAR)
+
+        assert sender._buffer == []
+
+    def test_flusher_woken_by_add(self):
+        sender = MetricsSender(flush_interval=0.01)
+        pipe_handler = Mock()
+        sender._pipe_handler = pipe_handler
+        sender._flusher = threading.Thread(target=sender._flush_periodically, daemon=True)
+        sender._flusher.start()
+
+        sender.add(tag="loss", value=1.0, data_type=AnalyticsDataType.SCALAR)
+        deadline = time.time() + 5.0
+        while not pipe_handler.send_to_peer.called and time.time() < deadline:
+            time.sleep(0.01)
+        sender.handle_event(EventType.END_RUN, FLContext())
+
+        pipe_handler.send_to_peer.assert_called_once()
+        assert not sender._flusher
+
+    def test_last_metrics_reach_relay_at_end_of_run(self):
+        components = {
+            "sender_pipe": MemoryPipe(token="metrics_sender_test", mode=Mode.ACTIVE),
+            "relay_pipe": MemoryPipe(token="metrics_sender_test", mode=Mode.PASSIVE),
+        }
+        engine = Mock()
+        engine.get_component.side_effect = components.get
+        fl_ctx = FLContext()
+        fl_ctx.set_prop(ReservedKey.ENGINE, engine, private=True, sticky=False)
+
+        # the relay's reader is too slow to pick up the last batch, so it must be delivered when the relay stops
+        relay = MetricRelay(pipe_id="relay_pipe", read_interval=30.0, fed_event=False)
+        relay.fire_event = Mock()
+        sender = MetricsSender(pipe_id="sender_pipe", flush_interval=30.0)
+        for event_type in [EventType.ABOUT_TO_START_RUN, EventType.BEFORE_TASK_EXECUTION]:
+            relay.handle_event(event_type, fl_ctx)
+            sender.handle_event(event_type, fl_ctx)
+
+        for i in range(3):
+            sender.add(tag="loss", value=float(i), data_type=AnalyticsDataType.SCALAR, global_step=i)
+
+        # the relay handles the end-of-run events first
+        for event_type in [EventType.ABOUT_TO_END_RUN, EventType.END_RUN]:
+            relay.handle_event(event_type, fl_ctx)
+            sender.handle_event(event_type, fl_ctx)
+
+        assert relay.fire_event.call_count == 3
+
+
+class TestMetricRelay:
+    def test_relay_batch(self):
+        relay = MetricRelay(pipe_id="pipe", fed_event=False)
+        relay._fl_ctx = FLContext()
+        relay.fire_event = Mock()
+        sender = MetricsSender()
+        sender._pipe_handler = Mock()
+        sender.add(tag="loss", value=1.0, data_type=AnalyticsDataType.SCALAR)
+        sender.add(tag="acc", value=0.5, data_type=AnalyticsDataType.SCALAR)
+        sender._flush()
+        msg: Message = sender._pipe_handler.send_to_peer.call_args[0][0]
+
+        relay._pipe_msg_cb(Message.new_request(topic=msg.topic, data=msg.data + ["bad"]))
+
+        assert relay.fire_event.call_count == 2
+
+    def test_relay_single_dxo(self):
+        relay = MetricRelay(pipe_id="pipe", fed_event=False)
+        relay._fl_ctx = FLContext()
+        relay.fire_event = Mock()
+
+        relay._pipe_msg_cb(Message.new_request(topic="metric", data=DXO(data_kind="METRICS", data={"value": 1})))
+
+        relay.fire_event.assert_called_once()
+
+    def test_metrics_in_order_when_stopped_during_relay(self):
+        sender_pipe = MemoryPipe(token="metric_relay_order_test", mode=Mode.ACTIVE)
+        engine = Mock()
+        engine.get_component.return_value = MemoryPipe(token="metric_relay_order_test", mode=Mode.PASSIVE)
+        fl_ctx = FLContext()
+        fl_ctx.set_prop(ReservedKey.ENGINE, engine, private=True, sticky=False)
+
+        relay = MetricRelay(pipe_id="relay_pipe", read_interval=0.01, fed_event=False)
+        relaying = threading.Event()
+        relayed = []
+
+        def _pipe_msg_cb(msg: Message):
+            if not relayed:
+                # keep the reader busy with the first batch while the relay is stopped
+                relaying.set()
+                time.sleep(0.2)
+            relayed.append(msg.data)
+
+        relay._pipe_msg_cb = _pipe_msg_cb
+        relay.handle_event(EventType.ABOUT_TO_START_RUN, fl_ctx)
+        relay.handle_event(EventType.BEFORE_TASK_EXECUTION, fl_ctx)
+        sender_pipe.open("metric")
+
+        sender_pipe.send(Message.new_request(topic="_metrics_sender", data=[0]))
+        assert relaying.wait(5.0)
+        sender_pipe.send(Message.new_request(topic="_metrics_sender", data=[1]))
+        relay.handle_event(EventType.END_RUN, fl_ctx)
+
+        assert relayed == [[0], [1]]
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import pytest
 
 from nvflare.apis.dxo import DXO, DataKind, from_shareable
@@ -98,3 +99,35 @@ class TestFLModelUtils:
         assert dxo.data[FLModelConst.PARAMS_TYPE] == ParamsType.FULL
         assert dxo.data[FLModelConst.CURRENT_ROUND] == current_round
         assert dxo.data[FLModelConst.TOTAL_ROUNDS] == num_rounds
+
+    @pytest.mark.parametrize("inplace", [True, False])
+    def test_update_model_with_diff(self, inplace):
+        weights = np.ones((2, 3), dtype=np.float32)
+        model = FLModel(params={"w": weights}, params_type=ParamsType.FULL)
+        model_update = FLModel(params={"w": np.full((2, 3), 2.0, dtype=np.float32)}, params_type=ParamsType.DIFF)
+
+        updated = FLModelUtils.update_model(model, model_update, inplace=inplace)
+
+        np.testing.assert_array_equal(updated.params["w"], np.full((2, 3), 3.0, dtype=np.float32))
+        assert (updated.params["w"] is weights) == inplace
+
+    def test_update_model_inplace_with_different_dtype(self):
+        weights = np.ones(3, dtype=np.int64)
+        model = FLModel(params={"w": weights}, params_type=ParamsType.FULL)
+        model_update = FLModel(params={"w": np.full(3, 0.5, dtype=np.float32)}, params_type=ParamsType.DIFF)
+
+        updated = FLModelUtils.update_model(model, model_update, inplace=True)
+
+        np.testing.assert_array_equal(updated.params["w"], np.full(3, 1.5))
+        assert updated.params["w"] is not weights
+
+    def test_update_model_inplace_with_different_shape(self):
+        weights = np.ones((2, 3), dtype=np.float32)
+        model = FLModel(params={"w": weights}, params_type=ParamsType.FULL)
+        model_update = FLModel(params={"w": np.full(3, 2.0, dtype=np.float32)}, params_type=ParamsType.DIFF)
+
+        updated = FLModelUtils.update_model(model, model_update, inplace=True)
+
+        np.testing.assert_array_equal(updated.params["w"], np.full((2, 3), 3.0, dtype=np.float32))
+        assert updated.params["w"] is not weights
+        np.testing.assert_array_equal(weights, np.ones((2, 3), dtype=np.float32))
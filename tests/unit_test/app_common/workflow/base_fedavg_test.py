@@ -0,0 +1,46 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from nvflare.apis.fl_context import FLContext
+from nvflare.app_common.abstract.fl_model import FLModel, ParamsType
+from nvflare.app_common.workflows.base_fedavg import BaseFedAvg
+
+
+class _FedAvg(BaseFedAvg):
+    def run(self):
+        pass
+
+
+class TestBaseFedAvgUpdateModel:
+    @pytest.mark.parametrize("inplace_update", [None, False, True])
+    def test_update_model_with_diff(self, inplace_update):
+        kwargs = {} if inplace_update is None else {"inplace_update": inplace_update}
+        controller = _FedAvg(**kwargs)
+        controller.fl_ctx = FLContext()
+        controller.event = Mock()
+
+        weights = np.ones(3, dtype=np.float32)
+        model = FLModel(params={"w": weights}, params_type=ParamsType.FULL)
+        aggr_result = FLModel(params={"w": np.full(3, 2.0, dtype=np.float32)}, params_type=ParamsType.DIFF)
+
+        updated = controller.update_model(model, aggr_result)
+
+        np.testing.assert_array_equal(updated.params["w"], np.full(3, 3.0, dtype=np.float32))
+        # params are only modified in place when explicitly enabled
+        assert (updated.params["w"] is weights) == bool(inplace_update)
@@ -0,0 +1,56 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from nvflare.apis.fl_constant import FLMetaKey
+from nvflare.apis.fl_context import FLContext
+from nvflare.app_common.abstract.fl_model import FLModel, ParamsType
+from nvflare.app_common.workflows.fedavg import FedAvg
+
+
+class TestFedAvg:
+    def test_straggler_settings_passed_to_send(self):
+        controller = FedAvg(num_clients=3, num_rounds=1, min_responses=2, train_timeout=10)
+        controller.fl_ctx = FLContext()
+        controller.load_model = Mock(return_value=FLModel(params={"w": np.zeros(2)}, params_type=ParamsType.FULL))
+        controller.save_model = Mock()
+        controller.sample_clients = Mock(return_value=["site-1", "site-2", "site-3"])
+        controller.send_model_and_wait = Mock(
+            return_value=[
+                FLModel(
+                    params={"w": np.ones(2)},
+                    params_type=ParamsType.FULL,
+                    meta={FLMetaKey.NUM_STEPS_CURRENT_ROUND: 1, "client_name": f"site-{i + 1}"},
+                )
+                for i in range(2)
+            ]
+        )
+        controller.event = Mock()
+        controller.fire_event_with_data = Mock()
+        controller.info = Mock()
+
+        controller.run()
+
+        _, kwargs = controller.send_model_and_wait.call_args
+        assert kwargs["min_responses"] == 2
+        assert kwargs["timeout"] == 10
+
+    @pytest.mark.parametrize("min_responses,train_timeout", [(0, 0), (2, -1)])
+    def test_invalid_straggler_settings(self, min_responses, train_timeout):
+        with pytest.raises(ValueError):
+            FedAvg(min_responses=min_responses, train_timeout=train_timeout)
@@ -0,0 +1,95 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import torch
+
+from nvflare.app_opt.pt.ditto import PTDittoHelper
+
+
+def _create_helper(app_dir):
+    model = torch.nn.Linear(4, 2)
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+    return PTDittoHelper(
+        criterion=torch.nn.MSELoss(),
+        model=model,
+        optimizer=optimizer,
+        device=torch.device("cpu"),
+        app_dir=app_dir,
+    )
+
+
+class TestPTDittoHelper:
+    def test_load_global_weights_first_round(self, tmp_path):
+        helper = _create_helper(str(tmp_path))
+        global_weights = {k: torch.ones_like(v) for k, v in helper.model.state_dict().items()}
+
+        helper.load_model(global_weights)
+
+        assert helper.epoch_of_start_time == 0
+        for v in helper.model.state_dict().values():
+            assert torch.equal(v, torch.ones_like(v))
+
+    def test_save_and_load_model(self, tmp_path):
+        helper = _create_helper(str(tmp_path))
+        helper.epoch_global = 3
+        helper.update_metric_save_model(0.75)
+        saved_weights = {k: v.clone() for k, v in helper.model.state_dict().items()}
+
+        assert os.path.exists(helper.model_file_path)
+        assert os.path.exists(helper.best_model_file_path)
+        assert not os.path.exists(helper.model_file_path + ".tmp")
+
+        new_helper = _create_helper(str(tmp_path))
+        global_weights = {k: torch.zeros_like(v) for k, v in new_helper.model.state_dict().items()}
+        new_helper.load_model(global_weights)
+
+        assert new_helper.epoch_of_start_time == 3
+        assert new_helper.best_metric == 0.75
+        for k, v in new_helper.model.state_dict().items():
+            assert torch.equal(v, saved_weights[k])
+
+    def test_best_model_only_saved_on_improvement(self, tmp_path):
+        helper = _create_helper(str(tmp_path))
+        helper.update_metric_save_model(0.5)
+        helper.update_metric_save_model(0.25)
+
+        new_helper = _create_helper(str(tmp_path))
+        new_helper.load_model({})
+
+        assert new_helper.best_metric == 0.5
+
+    def test_tensor_best_metric(self, tmp_path):
+        helper = _create_helper(str(tmp_path))
+        helper.update_metric_save_model(torch.tensor(0.75))
+
+        new_helper = _create_helper(str(tmp_path))
+        new_helper.load_model({})
+
+        assert new_helper.best_metric == 0.75
+
+    def test_load_legacy_checkpoints(self, tmp_path):
+        helper = _create_helper(str(tmp_path))
+        saved_weights = {k: torch.full_like(v, 2.0) for k, v in helper.model.state_dict().items()}
+        torch.save({"model": saved_weights, "epoch": 4}, helper.legacy_model_file_path)
+        torch.save({"model": saved_weights, "epoch": 4, "best_metric": 0.6}, helper.legacy_best_model_file_path)
+
+        global_weights = {k: torch.zeros_like(v) for k, v in helper.model.state_dict().items()}
+        helper.load_model(global_weights)
+
+        assert helper.epoch_of_start_time == 4
+        assert helper.best_metric == 0.6
+        for k, v in helper.model.state_dict().items():
+            assert torch.equal(v, saved_weights[k])
@@ -0,0 +1,112 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib.util
+import os
+from unittest.mock import Mock
+
+import pytest
+import torch
+
+from nvflare.apis.fl_constant import FLMetaKey
+from nvflare.apis.fl_context import FLContext
+from nvflare.app_common.abstract.fl_model import FLModel, ParamsType
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+EXAMPLE_FEDAVG = os.path.join(
+    REPO_ROOT, "examples", "advanced", "code-pre-install", "jobs", "fedavg", "app_server", "custom", "src", "fedavg.py"
+)
+
+
+def _load_example_fedavg():
+    spec = importlib.util.spec_from_file_location("example_fedavg", EXAMPLE_FEDAVG)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.FedAvg
+
+
+class TestExampleFedAvgBestModel:
+    @pytest.mark.parametrize("stop_cond", ["accuracy > 0.9", "accuracy >= 0.9"])
+    def test_best_model_kept_when_metric_gets_worse(self, tmp_path, stop_cond):
+        save_path = str(tmp_path / "best_model.pt")
+        controller = _load_example_fedavg()(num_clients=1, num_rounds=3, stop_cond=stop_cond, save_filename=save_path)
+        accuracies = iter([0.5, 0.3, 0.7])
+
+        def _send_model_and_wait(targets, data, **kwargs):
+            return [
+                FLModel(
+                    params={"w": torch.full((2,), float(data.current_round))},
+                    params_type=ParamsType.FULL,
+                    metrics={"accuracy": next(accuracies)},
+                    current_round=data.current_round,
+                    meta={FLMetaKey.NUM_STEPS_CURRENT_ROUND: 1, "client_name": "site-1"},
+                )
+            ]
+
+        saved_accuracies = []
+        save_model = controller.save_model
+
+        def _save_model(model, filepath=""):
+            saved_accuracies.append(model.metrics["accuracy"])
+            save_model(model, filepath)
+
+        controller.fl_ctx = FLContext()
+        controller.sample_clients = Mock(return_value=["site-1"])
+        controller.send_model_and_wait = _send_model_and_wait
+        controller.event = Mock()
+        controller.fire_event_with_data = Mock()
+        controller.info = Mock()
+        controller.save_model = _save_model
+
+        controller.run()
+
+        # round 1 is worse than round 0 and must not replace or overwrite the best model
+        assert saved_accuracies == [0.5, 0.7]
+        assert controller.best_model.metrics["accuracy"] == 0.7
+        saved_model = controller.load_model(save_path)
+        assert torch.equal(saved_model.params["w"], torch.full((2,), 2.0))
+        assert saved_model.metrics["accuracy"] == 0.7
+
+    def test_best_model_params_kept_with_inplace_update(self):
+        initial_model = Mock()
+        initial_model.state_dict.return_value = {"w": torch.zeros(2)}
+        controller = _load_example_fedavg()(
+            num_clients=1, num_rounds=2, stop_cond="accuracy > 0.9", initial_model=initial_model, inplace_update=True
+        )
+        accuracies = iter([0.5, 0.3])
+
+        def _send_model_and_wait(targets, data, **kwargs):
+            return [
+                FLModel(
+                    params={"w": torch.ones(2)},
+                    params_type=ParamsType.DIFF,
+                    metrics={"accuracy": next(accuracies)},
+                    current_round=data.current_round,
+                    meta={FLMetaKey.NUM_STEPS_CURRENT_ROUND: 1, "client_name": "site-1"},
+                )
+            ]
+
+        controller.fl_ctx = FLContext()
+        controller.sample_clients = Mock(return_value=["site-1"])
+        controller.send_model_and_wait = _send_model_and_wait
+        controller.event = Mock()
+        controller.fire_event_with_data = Mock()
+        controller.info = Mock()
+        controller.save_model = Mock()
+
+        controller.run()
+
+        # round 1 adds into the global model's params in place, which must not change the best model of round 0
+        assert torch.equal(controller.best_model.params["w"], torch.ones(2))
+
@@ -0,0 +1,181 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+import torch
+
+from nvflare.apis.fl_constant import FLMetaKey
+from nvflare.apis.fl_context import FLContext
+from nvflare.app_common.abstract.fl_model import FLModel, ParamsType
+from nvflare.app_common.workflows.base_fedavg import BaseFedAvg
+from nvflare.app_opt.pt.fedavg_early_stopping import PTFedAvgEarlyStopping
+from nvflare.fuel.utils import fobs
+
+
+def _create_results(params_list, weights, metrics_list=None):
+    results = []
+    for i, (params, weight) in enumerate(zip(params_list, weights)):
+        results.append(
+            FLModel(
+                params=params,
+                params_type=ParamsType.FULL,
+                metrics=metrics_list[i] if metrics_list else None,
+                current_round=1,
+                meta={FLMetaKey.NUM_STEPS_CURRENT_ROUND: weight, "client_name": f"site-{i + 1}"},
+            )
+        )
+    return results
+
+
+class TestPTFedAvgEarlyStoppingAggregation:
+    @pytest.mark.parametrize("weights", [[1.0, 1.0, 1.0], [1, 2, 5]])
+    def test_aggregate_matches_default(self, weights):
+        torch.manual_seed(0)
+        params_list = [
+            {
+                "conv.weight": torch.randn(4, 3, 3, 3),
+                "fc.bias": torch.randn(10),
+                "bn.num_batches_tracked": torch.tensor(i + 1, dtype=torch.long),
+            }
+            for i in range(len(weights))
+        ]
+        metrics_list = [{"accuracy": 0.1 * (i + 1)} for i in range(len(weights))]
+
+        result = PTFedAvgEarlyStopping.aggregate_fn(_create_results(params_list, weights, metrics_list))
+        expected = BaseFedAvg.aggregate_fn(_create_results(params_list, weights, metrics_list))
+
+        assert result.params.keys() == expected.params.keys()
+        for k, v in expected.params.items():
+            torch.testing.assert_close(result.params[k], v.to(result.params[k].dtype))
+        assert result.metrics["accuracy"] == pytest.approx(expected.metrics["accuracy"])
+        assert result.meta == expected.meta
+        assert result.params_type == ParamsType.FULL
+
+    def test_aggregated_params_do_not_share_storage(self):
+        params_list = [{"a": torch.ones(2, 2), "b": torch.zeros(3)} for _ in range(2)]
+
+        result = PTFedAvgEarlyStopping.aggregate_fn(_create_results(params_list, [1.0, 1.0]))
+
+        assert result.params["a"].untyped_storage().data_ptr() != result.params["b"].untyped_storage().data_ptr()
+        assert result.params["a"].shape == (2, 2)
+        assert result.params["b"].shape == (3,)
+
+    def test_aggregate_non_tensor_params(self):
+        params_list = [{"w": np.ones(3)}, {"w": np.full(3, 3.0)}]
+
+        result = PTFedAvgEarlyStopping.aggregate_fn(_create_results(params_list, [1.0, 1.0]))
+
+        np.testing.assert_array_almost_equal(result.params["w"], np.full(3, 2.0))
+        assert result.metrics is None
+
+    def test_aggregate_empty_results(self):
+        with pytest.raises(ValueError):
+            PTFedAvgEarlyStopping.aggregate_fn([])
+
+
+class TestPTFedAvgEarlyStoppingRun:
+    def test_best_model_saved(self, tmp_path):
+        save_path = str(tmp_path / "best_model.pt")
+        controller = PTFedAvgEarlyStopping(
+            num_clients=1, num_rounds=3, stop_cond="accuracy >= 0.9", save_filename=save_path
+        )
+        accuracies = iter([0.5, 0.3, 0.7])
+
+        def _send_model_and_wait(task_name, targets, data, **kwargs):
+            return _create_results(
+                [{"w": torch.full((2,), float(data.current_round))}], [1.0], [{"accuracy": next(accuracies)}]
+            )
+
+        controller.fl_ctx = FLContext()
+        controller.sample_clients = Mock(return_value=["site-1"])
+        controller.send_model_and_wait = _send_model_and_wait
+        controller.event = Mock()
+        controller.fire_event_with_data = Mock()
+        controller.info = Mock()
+
+        controller.run()
+
+        saved_model = controller.load_model(save_path)
+        assert torch.equal(saved_model.params["w"], torch.full((2,), 2.0))
+        assert saved_model.metrics["accuracy"] == 0.7
+        assert controller.best_target_metric_value == 0.7
+
+    def test_straggler_settings_passed_to_send(self):
+        controller = PTFedAvgEarlyStopping(num_clients=3, num_rounds=1, min_responses=2, train_timeout=10)
+        controller.fl_ctx = FLContext()
+        controller.sample_clients = Mock(return_value=["site-1", "site-2", "site-3"])
+        controller.send_model_and_wait = Mock(
+            return_value=_create_results([{"w": torch.ones(2)}, {"w": torch.ones(2)}], [1.0, 1.0])
+        )
+        controller.event = Mock()
+        controller.fire_event_with_data = Mock()
+        controller.info = Mock()
+        controller.save_model = Mock()
+
+        controller.run()
+
+        _, kwargs = controller.send_model_and_wait.call_args
+        assert kwargs["min_responses"] == 2
+        assert kwargs["timeout"] == 10
+
+    @pytest.mark.parametrize("min_responses,train_timeout", [(0, 0), (2, -1)])
+    def test_invalid_straggler_settings(self, min_responses, train_timeout):
+        with pytest.raises(ValueError):
+            PTFedAvgEarlyStopping(min_responses=min_responses, train_timeout=train_timeout)
+
+
+class TestPTFedAvgEarlyStoppingSaveLoad:
+    @pytest.mark.parametrize("filename", ["model.pt", "model.safetensors"])
+    def test_save_and_load_model(self, tmp_path, filename):
+        filepath = str(tmp_path / filename)
+        controller = PTFedAvgEarlyStopping()
+        params = {"w": torch.randn(2, 3).t(), "b": torch.zeros(3)}
+        model = FLModel(params=params, params_type=ParamsType.FULL, metrics={"accuracy": 0.5}, current_round=2)
+
+        controller.save_model(model, filepath)
+        loaded = controller.load_model(filepath)
+
+        assert model.params is params
+        assert loaded.params.keys() == params.keys()
+        for k, v in params.items():
+            assert torch.equal(loaded.params[k], v)
+        assert loaded.metrics == {"accuracy": 0.5}
+        assert loaded.current_round == 2
+
+    def test_load_legacy_model(self, tmp_path):
+        filepath = str(tmp_path / "model.pt")
+        torch.save({"w": torch.ones(3)}, filepath)
+        fobs.dumpf(FLModel(params={}, params_type=ParamsType.FULL), f"{filepath}.metadata")
+
+        loaded = PTFedAvgEarlyStopping().load_model(filepath)
+
+        assert torch.equal(loaded.params["w"], torch.ones(3))
+
+    def test_default_format_is_torch_save(self, tmp_path):
+        filepath = str(tmp_path / "FL_global_model.pt")
+        model = FLModel(params={"w": torch.ones(3)}, params_type=ParamsType.FULL)
+
+        PTFedAvgEarlyStopping().save_model(model, filepath)
+
+        assert torch.equal(torch.load(filepath)["w"], torch.ones(3))
+
+    def test_save_non_tensor_params_as_safetensors(self, tmp_path):
+        filepath = str(tmp_path / "model.safetensors")
+        model = FLModel(params={"w": np.ones(3)}, params_type=ParamsType.FULL)
+
+        with pytest.raises(ValueError):
+            PTFedAvgEarlyStopping().save_model(model, filepath)
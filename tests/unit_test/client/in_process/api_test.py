@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+import time
 import unittest
 
 from nvflare.apis.fl_constant import FLMetaKey
@@ -92,4 +94,13 @@ class TestInProcessClientAPI(unittest.TestCase):
             TOPIC_STOP,
         ]
 
+    def test_receive_wakes_up_on_stop(self):
+        client_api = InProcessClientAPI(self.task_metadata, result_check_interval=30.0)
+        client_api.init()
+        threading.Timer(0.1, client_api.shutdown).start()
+
+        start = time.time()
+        assert client_api.receive() is None
+        assert time.time() - start < 5.0
+
     # Add more test methods for other functionalities in the class
@@ -47,3 +47,9 @@ class TestClassUtils:
         parameters = get_component_init_parameters(b)
 
         assert parameters == expected_parameters
+
+    def test_init_parameters_not_shared(self):
+        parameters = get_component_init_parameters(A(name="name"))
+        parameters.pop("name")
+
+        assert "name" in get_component_init_parameters(A(name="name"))
@@ -0,0 +1,66 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+from nvflare.fuel.utils.constants import Mode
+from nvflare.fuel.utils.pipe.memory_pipe import MemoryPipe
+from nvflare.fuel.utils.pipe.pipe import Message, Topic
+from nvflare.fuel.utils.pipe.pipe_handler import PipeHandler
+
+
+class TestPipeHandler:
+    def test_pending_messages_read_without_waiting(self):
+        sender = MemoryPipe(token="pipe_handler_test", mode=Mode.ACTIVE)
+        receiver = MemoryPipe(token="pipe_handler_test", mode=Mode.PASSIVE)
+        sender.open("test")
+        receiver.open("test")
+        num_msgs = 20
+        for i in range(num_msgs):
+            sender.send(Message.new_request(topic="metric", data=i))
+
+        # reading one message per read_interval would take num_msgs seconds
+        handler = PipeHandler(receiver, read_interval=1.0, heartbeat_interval=5.0, heartbeat_timeout=0)
+        received = []
+        handler.set_message_cb(lambda msg: received.append(msg.data))
+        try:
+            handler.start()
+            start = time.time()
+            while len(received) < num_msgs and time.time() - start < num_msgs / 2:
+                time.sleep(0.1)
+        finally:
+            handler.stop()
+
+        assert received == list(range(num_msgs))
+
+    def test_heartbeat_sender_stops_right_away(self):
+        sender = MemoryPipe(token="pipe_handler_heartbeat_test", mode=Mode.ACTIVE)
+        receiver = MemoryPipe(token="pipe_handler_heartbeat_test", mode=Mode.PASSIVE)
+        sender.open("test")
+        receiver.open("test")
+        handler = PipeHandler(sender, read_interval=0.1, heartbeat_interval=30.0, heartbeat_timeout=0)
+        handler.start()
+        heartbeat_sender = handler.heartbeat_sender
+
+        # the first heartbeat is sent right away
+        start = time.time()
+        msg = None
+        while msg is None and time.time() - start < 5.0:
+            msg = receiver.receive()
+            time.sleep(0.01)
+        handler.stop()
+        heartbeat_sender.join(timeout=5.0)
+
+        assert msg.topic == Topic.HEARTBEAT
+        assert not heartbeat_sender.is_alive()
@@ -11,8 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import os
 import tempfile
+from unittest.mock import patch
+
+import pytest
 
 from nvflare.job_config.fed_job_config import FedJobConfig
 
@@ -40,3 +44,52 @@ class TestFedJobConfig:
         assert expected == job_config._trim_whitespace("site-0, site-1")
         assert expected == job_config._trim_whitespace(" site-0,site-1 ")
         assert expected == job_config._trim_whitespace(" site-0, site-1 ")
+
+    def test_generate_job_config_replaces_old_job(self, tmp_path):
+        job_config = FedJobConfig(job_name="job_name", min_clients=1)
+        job_dir = tmp_path / "job_name"
+        os.makedirs(job_dir / "app" / "custom")
+        (job_dir / "meta.json").write_text("{}")
+        (job_dir / "app" / "custom" / "old.py").write_text("")
+
+        job_config.generate_job_config(str(tmp_path))
+
+        # the old job folder is removed right away, without leaving anything else behind
+        assert os.listdir(tmp_path) == ["job_name"]
+        assert os.listdir(job_dir) == ["meta.json"]
+        with open(job_dir / "meta.json") as f:
+            assert json.load(f)["name"] == "job_name"
+
+    def test_generate_job_config_reuses_empty_folder(self, tmp_path):
+        job_config = FedJobConfig(job_name="job_name", min_clients=1)
+        os.makedirs(tmp_path / "job_name")
+
+        job_config.generate_job_config(str(tmp_path))
+
+        assert os.listdir(tmp_path) == ["job_name"]
+        assert os.listdir(tmp_path / "job_name") == ["meta.json"]
+
+    def test_generate_job_config_invalid_folder(self, tmp_path):
+        job_config = FedJobConfig(job_name="job_name", min_clients=1)
+        os.makedirs(tmp_path / "job_name")
+        (tmp_path / "job_name" / "data.txt").write_text("")
+
+        with pytest.raises(RuntimeError):
+            job_config.generate_job_config(str(tmp_path))
+
+    def test_get_custom_file_skips_fl_packages(self, tmp_path):
+        job_config = FedJobConfig(job_name="job_name", min_clients=1)
+        module = FedJobConfig.__module__
+        source_file = os.path.abspath(module.replace(".", os.sep) + ".py")
+
+        with patch("nvflare.job_config.fed_job_config.os.path.exists") as exists:
+            job_config._get_custom_file(str(tmp_path), module, source_file)
+
+        exists.assert_not_called()
+        assert job_config.custom_modules == []
+
+    def test_get_deploy_map(self):
+        job_config = FedJobConfig(job_name="job_name", min_clients=1)
+        job_config.deploy_map = {"server": "app_server", "site-1": "app", "site-2": "app"}
+
+        assert job_config._get_deploy_map() == {"app_server": ["server"], "app": ["site-1", "site-2"]}
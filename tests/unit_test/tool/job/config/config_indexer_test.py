@@ -14,7 +14,7 @@
 
 from pyhocon import ConfigFactory as CF
 
-from nvflare.tool.job.config.config_indexer import KeyIndex, build_dict_reverse_order_index
+from nvflare.tool.job.config.config_indexer import KeyIndex, _get_init_parameters, build_dict_reverse_order_index
 from nvflare.tool.job.config.configer import extract_string_with_index, filter_config_name_and_values
 
 
@@ -170,3 +170,15 @@ class TestConfigIndex:
         assert key_index.value == "data.csv"
         key_index = result["other_path"]
         assert key_index.value is None
+
+    def test_init_parameters_after_failed_import(self, tmp_path, monkeypatch):
+        assert _get_init_parameters("config_indexer_custom_mod", "Trainer") is None
+
+        # a custom folder added to sys.path later in the same process makes the class importable
+        (tmp_path / "config_indexer_custom_mod.py").write_text(
+            "class Trainer:\n    def __init__(self, lr=0.1):\n        pass\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        params = _get_init_parameters("config_indexer_custom_mod", "Trainer")
+        assert [p.name for p in params] == ["self", "lr"]
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import argparse
+import os
+
 import pytest
 
 from nvflare.tool.job import job_cli
@@ -31,3 +34,45 @@ class TestJobCLI:
     def test_is_sub_dir(self, path, directory, expected):
         print(f"{input=}, {directory=}, {expected=}")
         assert expected == job_cli.is_subdir(path, directory)
+
+    def test_load_default_config_template_returns_copy(self):
+        config = job_cli.load_default_config_template("meta.conf")
+        name = config.get("name")
+        config.put("name", "my_job")
+
+        assert job_cli.load_default_config_template("meta.conf").get("name") == name
+
+    def test_remove_pycache_files(self, tmp_path):
+        os.makedirs(tmp_path / "pkg" / "__pycache__" / "nested")
+        (tmp_path / "pkg" / "__pycache__" / "mod.cpython-310.pyc").write_bytes(b"")
+        (tmp_path / "pkg" / "mod.py").write_text("")
+
+        job_cli.remove_pycache_files(str(tmp_path))
+
+        assert not os.path.exists(tmp_path / "pkg" / "__pycache__")
+        assert os.path.isfile(tmp_path / "pkg" / "mod.py")
+
+    def test_prepare_app_scripts_skips_pycache(self, tmp_path):
+        script_dir = tmp_path / "code"
+        os.makedirs(script_dir / "__pycache__")
+        (script_dir / "__pycache__" / "train.cpython-310.pyc").write_bytes(b"")
+        (script_dir / "train.py").write_text("")
+        app_custom_dir = tmp_path / "job" / "app" / "custom"
+        cmd_args = argparse.Namespace(script_dir=str(script_dir))
+
+        job_cli.prepare_app_scripts(str(tmp_path / "job"), [str(app_custom_dir)], cmd_args)
+
+        assert os.listdir(app_custom_dir) == ["train.py"]
+
+    def test_prepare_app_scripts_removes_existing_pycache(self, tmp_path):
+        script_dir = tmp_path / "code"
+        os.makedirs(script_dir)
+        (script_dir / "train.py").write_text("")
+        app_custom_dir = tmp_path / "job" / "app" / "custom"
+        os.makedirs(app_custom_dir / "__pycache__")
+        (app_custom_dir / "__pycache__" / "train.cpython-310.pyc").write_bytes(b"")
+        cmd_args = argparse.Namespace(script_dir=str(script_dir))
+
+        job_cli.prepare_app_scripts(str(tmp_path / "job"), [str(app_custom_dir)], cmd_args)
+
+        assert os.listdir(app_custom_dir) == ["train.py"]
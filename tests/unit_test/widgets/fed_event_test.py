@@ -0,0 +1,96 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from nvflare.apis.event_type import EventType
+from nvflare.apis.fl_constant import FedEventHeader, ReservedKey, ReturnCode
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.shareable import Shareable
+from nvflare.apis.signal import Signal
+from nvflare.widgets.fed_event import FedEventRunner
+
+
+def _make_fed_event(peer_name: str, event_type: str, timestamp: float) -> Shareable:
+    request = Shareable()
+    request.set_peer_props({ReservedKey.IDENTITY_NAME: peer_name})
+    request.set_header(FedEventHeader.TIMESTAMP, timestamp)
+    request.set_header(FedEventHeader.EVENT_TYPE, event_type)
+    return request
+
+
+def _create_runner(**kwargs):
+    runner = FedEventRunner(**kwargs)
+    runner.abort_signal = Signal()
+    runner.engine = MagicMock()
+    runner.engine.new_context.side_effect = FLContext
+    runner.posted = []
+    runner.all_posted = threading.Event()
+
+    def _fire_event(event_type, fl_ctx):
+        runner.posted.append(event_type)
+        runner.all_posted.set()
+
+    runner.engine.fire_event.side_effect = _fire_event
+    return runner
+
+
+class TestFedEventRunner:
+    def test_events_posted_in_order(self):
+        runner = _create_runner(grace_period=0.1)
+        for i in range(5):
+            reply = runner._receive("fed.event", _make_fed_event("site-1", f"event_{i}", i + 1.0), FLContext())
+            assert reply.get_return_code() == ReturnCode.OK
+
+        runner.handle_event(EventType.END_RUN, FLContext())
+
+        assert runner.posted == [f"event_{i}" for i in range(5)]
+        assert not runner.poster.is_alive()
+
+    def test_event_posted_without_waiting_for_interval(self):
+        # with a long regular interval, the new event must still be posted right away
+        runner = _create_runner(regular_interval=10.0, grace_period=0.1)
+        runner._receive("fed.event", _make_fed_event("site-1", "event_0", 1.0), FLContext())
+        assert runner.all_posted.wait(5.0)
+        runner.all_posted.clear()
+
+        start = time.time()
+        runner._receive("fed.event", _make_fed_event("site-1", "event_1", 2.0), FLContext())
+        assert runner.all_posted.wait(5.0)
+        assert time.time() - start < 5.0
+
+        runner.handle_event(EventType.END_RUN, FLContext())
+        assert runner.posted == ["event_0", "event_1"]
+        assert not runner.poster.is_alive()
+
+    def test_old_events_ignored(self):
+        runner = _create_runner(grace_period=0.1)
+        runner._receive("fed.event", _make_fed_event("site-1", "event_new", 2.0), FLContext())
+        runner._receive("fed.event", _make_fed_event("site-1", "event_old", 1.0), FLContext())
+
+        runner.handle_event(EventType.END_RUN, FLContext())
+
+        assert runner.posted == ["event_new"]
+
+    def test_missing_peer_name(self):
+        runner = _create_runner()
+        request = Shareable()
+        request.set_header(FedEventHeader.TIMESTAMP, 1.0)
+
+        reply = runner._receive("fed.event", request, FLContext())
+
+        assert reply.get_return_code() == ReturnCode.MISSING_PEER_CONTEXT
+        assert runner.poster is None